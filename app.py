@@ -162,7 +162,7 @@ def main():
             # garante que o novo case fique selecionado
             st.session_state["selected_case_index"] = len(cases) - 1
             st.success(f"Case '{new_case_name.strip()}' criado com sucesso.")
-            st.experimental_rerun()
+            st.rerun()
 
         # Se não houver cases depois da criação, exibe mensagem e encerra
         if not cases:
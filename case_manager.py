@@ -10,11 +10,17 @@
 from __future__ import annotations
 
 import json
+import os
 import re
 from pathlib import Path
 from datetime import date, datetime
 from typing import List, Dict, Any, Optional
 
+try:
+    import fcntl
+except ImportError:  # Windows: sem lock entre escritores
+    fcntl = None
+
 
 # --------------------------------------------------------------------
 # Caminho padrão do arquivo de cases
@@ -40,6 +46,16 @@ def get_cases_path() -> Path:
     return data_dir / "cases.json"
 
 
+def get_case_exports_dir() -> Path:
+    """
+    Pasta dos exports por case (um JSON por case, gravado pelo export):
+        data/case_exports/<case_id>.json
+    """
+    exports_dir = _get_project_root() / "data" / "case_exports"
+    exports_dir.mkdir(parents=True, exist_ok=True)
+    return exports_dir
+
+
 # --------------------------------------------------------------------
 # Serialização / desserialização de datas
 # --------------------------------------------------------------------
@@ -213,7 +229,42 @@ def load_cases() -> List[Dict[str, Any]]:
     except Exception:
         return []
 
-    return _deserialize_cases(raw)
+    cases = _deserialize_cases(raw)
+    _apply_case_exports(cases)
+    return cases
+
+
+def _read_json_dict(path: Path) -> Dict[str, Any]:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except Exception:
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _apply_case_exports(cases: List[Dict[str, Any]]) -> None:
+    """
+    Sobrepõe aos cases os exports gravados por update_case_exports em
+    data/case_exports/ (têm precedência sobre o "exports" do cases.json).
+    """
+    exports_dir = get_case_exports_dir()
+    try:
+        available = set(os.listdir(exports_dir))
+    except OSError:
+        return
+
+    for case in cases:
+        name = f"{case['id']}.json"
+        if name not in available:
+            continue
+        record = _read_json_dict(exports_dir / name)
+        exports = record.get("exports")
+        if isinstance(exports, dict):
+            case["exports"] = {**case["exports"], **exports}
+        if record.get("last_updated_at"):
+            last_updated_at = _deserialize_date(record["last_updated_at"])
+            if last_updated_at > case["last_updated_at"]:
+                case["last_updated_at"] = last_updated_at
 
 
 def save_cases(cases: List[Dict[str, Any]]) -> None:
@@ -222,7 +273,17 @@ def save_cases(cases: List[Dict[str, Any]]) -> None:
     """
     path = get_cases_path()
     serialized = _serialize_cases(cases)
-    path.write_text(json.dumps(serialized, ensure_ascii=False, indent=2), encoding="utf-8")
+    _write_cases_file(path, serialized)
+
+
+def _write_cases_file(path: Path, raw_list: List[Dict[str, Any]]) -> None:
+    """
+    Grava a lista (já serializável) em arquivo temporário + os.replace:
+    quem lê o cases.json nunca vê um arquivo pela metade.
+    """
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_text(json.dumps(raw_list, ensure_ascii=False, indent=2), encoding="utf-8")
+    os.replace(tmp_path, path)
 
 
 # --------------------------------------------------------------------
@@ -322,6 +383,60 @@ def attach_exports_to_case(
     return cases
 
 
+def update_case_exports(
+    case_id: str,
+    *,
+    pdf_path: Optional[str] = None,
+    json_summary_path: Optional[str] = None,
+    json_messages_path: Optional[str] = None,
+    bundle_path: Optional[str] = None,
+) -> bool:
+    """
+    Atualiza os caminhos de exports de UM case direto no disco.
+
+    Os exports ficam em data/case_exports/<case_id>.json (load_cases os
+    sobrepõe ao cases.json): o export, que roda em thread, não reescreve
+    o cases.json inteiro nem disputa com o save_cases da UI. A leitura +
+    gravação do arquivo do case acontece sob lock exclusivo
+    (<case_id>.json.lock), então exports concorrentes do mesmo case não
+    perdem atualizações; tmp + os.replace evita arquivo pela metade.
+
+    Retorna False se não for possível gravar.
+    """
+    path = get_case_exports_dir() / f"{_make_safe_case_id(case_id)}.json"
+    tmp_path = path.with_suffix(".json.tmp")
+    lock_path = path.with_suffix(".json.lock")
+    try:
+        with lock_path.open("w") as lock:
+            if fcntl is not None:
+                fcntl.flock(lock.fileno(), fcntl.LOCK_EX)
+            try:
+                exports = _read_json_dict(path).get("exports") or {}
+
+                if pdf_path is not None:
+                    exports["pdf"] = pdf_path
+                if json_summary_path is not None:
+                    exports["json_summary"] = json_summary_path
+                if json_messages_path is not None:
+                    exports["json_messages"] = json_messages_path
+                if bundle_path is not None:
+                    exports["bundle"] = bundle_path
+
+                record = {
+                    "exports": exports,
+                    "last_updated_at": _serialize_date(date.today()),
+                }
+                tmp_path.write_text(json.dumps(record, ensure_ascii=False, indent=2), encoding="utf-8")
+                os.replace(tmp_path, path)
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock.fileno(), fcntl.LOCK_UN)
+    except OSError:
+        return False
+
+    return True
+
+
 def log_case_event(
     cases: List[Dict[str, Any]],
     index: int,
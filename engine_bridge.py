@@ -3,16 +3,14 @@ import traceback
 from tese_engine.whatsapp_parser import parse_whatsapp
 from tese_engine.slack_parser import parse_slack
 
-from tese_engine.message_scorer import score_messages
-from tese_engine.incident_flagger import flag_incidents
-from tese_engine.pattern_aggregator import aggregate_patterns
+from tese_engine.pattern_aggregator import fused_pass
 from tese_engine.platform_correlator import correlate_platforms
 from tese_engine.timeline_builder import build_timeline
 from tese_engine.risk_orchestrator import orchestrate_risk
 
-from tese_engine.report_generator import generate_report
+from tese_engine.report_generator import generate_report, generate_report_lines
 from tese_engine.mindmap_generator import generate_mindmap
-from tese_engine.video_overview import generate_video_script
+from tese_engine.video_overview import generate_video_script, generate_video_script_lines
 from tese_engine.suggested_questions import generate_flashcards
 from tese_engine.ui_integration import generate_quiz
 
@@ -126,10 +124,9 @@ def run_full_analysis(parsed_data_per_platform: dict):
             elif isinstance(data, dict) and "messages" in data:
                 all_messages.extend(data["messages"])
 
-        scored = score_messages(all_messages)
-        flagged = flag_incidents(scored)
-        patterns = aggregate_patterns(flagged)
-        correlated = correlate_platforms(flagged)
+        # scoring + flagging + padrões + contagens em uma única passada
+        flagged, patterns, platform_counts, severity_counts = fused_pass(all_messages)
+        correlated = correlate_platforms(flagged, counts_by_platform=platform_counts)
         timeline = build_timeline(flagged)
 
         risk = orchestrate_risk(
@@ -137,6 +134,7 @@ def run_full_analysis(parsed_data_per_platform: dict):
             pattern_data=patterns,
             correlation_data=correlated,
             timeline_data=timeline,
+            severity_counts=severity_counts,
         )
 
         return {
@@ -179,3 +177,18 @@ def create_quiz(analysis_data):
 def create_audio_overview(analysis_data):
     # Placeholder for future TTS integration
     return "AUDIO_OVERVIEW_PLACEHOLDER"
+
+
+# Streaming variants: same text as the functions above, yielded line by line
+# (without "\n") so the UI can render partial output.
+
+def create_report_stream(analysis_data):
+    return generate_report_lines(analysis_data)
+
+
+def create_video_overview_stream(analysis_data):
+    return generate_video_script_lines(analysis_data)
+
+
+def create_audio_overview_stream(analysis_data):
+    yield create_audio_overview(analysis_data)
@@ -9,7 +9,9 @@
 #   - Helper build_all_outputs_for_case(...) que conecta um "case" (case_manager)
 #     com um case_id estável para todos os exports.
 
-from typing import Any, Dict, Optional
+from concurrent.futures import Executor, ThreadPoolExecutor
+from threading import Event
+from typing import Any, Callable, Dict, Iterator, Optional
 from pathlib import Path
 import re
 
@@ -20,6 +22,9 @@ from engine_bridge import (
     create_flashcards,
     create_quiz,
     create_audio_overview,
+    create_report_stream,
+    create_video_overview_stream,
+    create_audio_overview_stream,
 )
 
 from tese_engine.json_exporter import (
@@ -27,7 +32,7 @@ from tese_engine.json_exporter import (
     export_messages_json,
 )
 from tese_engine.bundle_exporter import create_light_bundle
-from tese_engine.pdf_exporter import export_to_pdf
+from tese_engine.pdf_exporter import ReportText, export_to_pdf
 
 
 # -----------------------------------------------------------
@@ -101,6 +106,13 @@ def _make_safe_case_id(raw: Optional[str]) -> str:
 # FUNÇÕES DE SAÍDA (CHAMADAS PELA UI E PELO STUDIO PANEL)
 # -----------------------------------------------------------
 
+def _error_message(output: str, e: Exception) -> str:
+    """
+    Mensagem de erro única dos build_* e build_*_stream de `output`.
+    """
+    return f"ERROR generating {output}: {str(e)}"
+
+
 def build_report(analysis_data: Dict[str, Any]) -> str:
     """
     Retorna conteúdo bruto do relatório TESE (string grande).
@@ -109,7 +121,7 @@ def build_report(analysis_data: Dict[str, Any]) -> str:
     try:
         return create_report(analysis_data)
     except Exception as e:
-        return f"ERROR generating report: {str(e)}"
+        return _error_message("report", e)
 
 
 def build_mindmap(analysis_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -121,7 +133,7 @@ def build_mindmap(analysis_data: Dict[str, Any]) -> Dict[str, Any]:
     except Exception as e:
         return {
             "error": True,
-            "message": f"ERROR generating mindmap: {str(e)}"
+            "message": _error_message("mindmap", e)
         }
 
 
@@ -132,7 +144,7 @@ def build_video_script(analysis_data: Dict[str, Any]) -> str:
     try:
         return create_video_overview(analysis_data)
     except Exception as e:
-        return f"ERROR generating video overview: {str(e)}"
+        return _error_message("video overview", e)
 
 
 def build_flashcards(analysis_data: Dict[str, Any]) -> Any:
@@ -144,7 +156,7 @@ def build_flashcards(analysis_data: Dict[str, Any]) -> Any:
     except Exception as e:
         return {
             "error": True,
-            "message": f"ERROR generating flashcards: {str(e)}"
+            "message": _error_message("flashcards", e)
         }
 
 
@@ -157,7 +169,7 @@ def build_quiz(analysis_data: Dict[str, Any]) -> Any:
     except Exception as e:
         return {
             "error": True,
-            "message": f"ERROR generating quiz: {str(e)}"
+            "message": _error_message("quiz", e)
         }
 
 
@@ -169,7 +181,84 @@ def build_audio_overview(analysis_data: Dict[str, Any]) -> str:
     try:
         return create_audio_overview(analysis_data)
     except Exception as e:
-        return f"ERROR generating audio overview: {str(e)}"
+        return _error_message("audio overview", e)
+
+
+# -----------------------------------------------------------
+# VERSÕES EM STREAMING (TEXTO LINHA A LINHA PARA A UI)
+# -----------------------------------------------------------
+# "\n".join(...) de cada gerador dá o mesmo texto do build_* equivalente.
+# Se a geração falhar, a última linha é a mesma mensagem de erro do
+# build_* (_error_message), depois das linhas já entregues.
+
+def build_report_stream(analysis_data: Dict[str, Any]) -> Iterator[str]:
+    """
+    Relatório TESE linha a linha (ver build_report).
+    """
+    try:
+        yield from create_report_stream(analysis_data)
+    except Exception as e:
+        yield _error_message("report", e)
+
+
+def build_video_script_stream(analysis_data: Dict[str, Any]) -> Iterator[str]:
+    """
+    Roteiro do vídeo overview linha a linha (ver build_video_script).
+    """
+    try:
+        yield from create_video_overview_stream(analysis_data)
+    except Exception as e:
+        yield _error_message("video overview", e)
+
+
+def build_audio_overview_stream(analysis_data: Dict[str, Any]) -> Iterator[str]:
+    """
+    Texto do áudio overview linha a linha (ver build_audio_overview).
+    """
+    try:
+        yield from create_audio_overview_stream(analysis_data)
+    except Exception as e:
+        yield _error_message("audio overview", e)
+
+
+# Builders independentes (só leem analysis_data), na ordem do retorno de
+# build_all_outputs_for_case
+_OUTPUT_BUILDERS = (
+    ("report", build_report),
+    ("mindmap", build_mindmap),
+    ("video_script", build_video_script),
+    ("flashcards", build_flashcards),
+    ("quiz", build_quiz),
+    ("audio", build_audio_overview),
+)
+
+
+def build_all_outputs(
+    analysis_data: Dict[str, Any],
+    executor: Optional[Executor] = None,
+) -> Dict[str, Any]:
+    """
+    Gera os seis outputs do Studio em paralelo (um worker por builder).
+
+    Tempo total ~ o do builder mais lento, em vez da soma de todos,
+    quando os builders esperam I/O (LLM, APIs). Cada build_* já trata
+    as próprias exceções, então f.result() não levanta.
+
+    `executor`: pool já existente (ex.: runtime.build_executor()); sem
+    ele, cria um pool temporário só para esta chamada.
+    """
+    if executor is not None:
+        futures = {
+            name: executor.submit(builder, analysis_data)
+            for name, builder in _OUTPUT_BUILDERS
+        }
+        return {name: f.result() for name, f in futures.items()}
+
+    with ThreadPoolExecutor(
+        max_workers=len(_OUTPUT_BUILDERS),
+        thread_name_prefix="tese-build",
+    ) as ex:
+        return build_all_outputs(analysis_data, executor=ex)
 
 
 # -----------------------------------------------------------
@@ -310,7 +399,7 @@ def export_tese_bundle(
 
 def export_case_pdf(
     analysis_data: Dict[str, Any],
-    report_text: str,
+    report_text: ReportText,
     case_id: str,
 ) -> Dict[str, Any]:
     """
@@ -318,6 +407,9 @@ def export_case_pdf(
 
         data/reports/<case_id>.pdf
 
+    report_text: o texto do relatório, ou uma função que gera as linhas
+    (ver pdf_exporter.export_to_pdf).
+
     Retorna:
         {
             "pdf_path": "str ou None",
@@ -344,10 +436,17 @@ def export_case_pdf(
 # HELPER: CONECTAR UM "CASE" (case_manager) AO case_id E EXPORTS
 # -----------------------------------------------------------
 
+class ExportCancelled(Exception):
+    """Export interrompido via `cancel` em build_all_outputs_for_case."""
+
+
 def build_all_outputs_for_case(
     case: Dict[str, Any],
     analysis_data: Dict[str, Any],
     include_messages: bool = True,
+    cancel: Optional[Event] = None,
+    on_step: Optional[Callable[[str], None]] = None,
+    executor: Optional[Executor] = None,
 ) -> Dict[str, Any]:
     """
     Helper backend-only.
@@ -355,6 +454,11 @@ def build_all_outputs_for_case(
     Recebe:
         - um dict de case (como retornado por case_manager.load_cases()[i])
         - o analysis_data retornado por run_full_analysis
+        - opcionalmente, um threading.Event `cancel` (checado antes de cada
+          etapa; se setado, levanta ExportCancelled) e um callback
+          `on_step(descricao)` chamado no início de cada etapa
+        - opcionalmente, o `executor` onde rodar os builders (ver
+          build_all_outputs)
 
     Faz:
         - Deriva um case_id estável (usando case["id"] se existir, senão o name)
@@ -377,17 +481,26 @@ def build_all_outputs_for_case(
             "pdf_export": {...},
         }
     """
+    def _step(description: str) -> None:
+        if cancel is not None and cancel.is_set():
+            raise ExportCancelled(f"Export cancelado antes de: {description}")
+        if on_step is not None:
+            on_step(description)
+
     # 1) Deriva case_id
     raw_id = case.get("id") or case.get("name") or "case"
     case_id = _make_safe_case_id(raw_id)
 
     # 2) Gera outputs em memória usando as funções já usadas pela UI
-    report = build_report(analysis_data)
-    mindmap = build_mindmap(analysis_data)
-    video_script = build_video_script(analysis_data)
-    flashcards = build_flashcards(analysis_data)
-    quiz = build_quiz(analysis_data)
-    audio = build_audio_overview(analysis_data)
+    #    (em paralelo, ver build_all_outputs)
+    _step("Gerando outputs")
+    built = build_all_outputs(analysis_data, executor=executor)
+    report = built["report"]
+    mindmap = built["mindmap"]
+    video_script = built["video_script"]
+    flashcards = built["flashcards"]
+    quiz = built["quiz"]
+    audio = built["audio"]
 
     outputs = {
         "report": report,
@@ -398,6 +511,7 @@ def build_all_outputs_for_case(
     }
 
     # 3) Exporta JSONs (summary + messages)
+    _step("Exportando JSON")
     json_exports = export_case_json_outputs(
         analysis_data=analysis_data,
         mindmap_data=mindmap,
@@ -406,6 +520,7 @@ def build_all_outputs_for_case(
     )
 
     # 4) Exporta bundle .tese
+    _step("Gerando bundle .tese")
     extra_meta = {
         "name": case.get("name"),
         "owner": case.get("owner"),
@@ -420,10 +535,12 @@ def build_all_outputs_for_case(
         extra_meta=extra_meta,
     )
 
-    # 5) Exporta PDF de relatório
+    # 5) Exporta PDF de relatório (linhas geradas em streaming, direto
+    #    para o PDF)
+    _step("Gerando PDF")
     pdf_export = export_case_pdf(
         analysis_data=analysis_data,
-        report_text=report,
+        report_text=lambda: create_report_stream(analysis_data),
         case_id=case_id,
     )
 
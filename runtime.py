@@ -0,0 +1,40 @@
+# runtime.py
+# Recursos compartilhados pelo processo Streamlit (TESE V9)
+#
+# Criados uma única vez via st.cache_resource e reaproveitados por todas
+# as sessões e reruns:
+#   - executor():       pool dos jobs do Studio (builders e export)
+#   - build_executor(): pool das tarefas "folha" do export (os seis build_*
+#                       de output_builder.build_all_outputs)
+#
+# São dois pools de propósito: um job de export roda no executor() e
+# espera pelos builders; se eles fossem para o mesmo pool, exports
+# simultâneos suficientes ocupariam todos os workers esperando tarefas
+# que nunca começam (deadlock).
+
+from concurrent.futures import ThreadPoolExecutor
+
+import streamlit as st
+
+
+@st.cache_resource(show_spinner=False)
+def executor() -> ThreadPoolExecutor:
+    """
+    Pool de threads único do processo para os jobs do Studio. Os workers
+    não chamam st.* (nem estes getters: não há ScriptRunContext na thread
+    do worker; recursos como build_executor() chegam por argumento). O
+    único estado que tocam é o dict do próprio job (ver
+    ui_studio_panel._submit_job): acrescentam a job["lines"] /
+    job["steps"] e gravam job["seconds"], que a thread do script só lê.
+    """
+    return ThreadPoolExecutor(max_workers=8, thread_name_prefix="tese-studio")
+
+
+@st.cache_resource(show_spinner=False)
+def build_executor() -> ThreadPoolExecutor:
+    """
+    Pool para os builders do export (um worker por output; ver
+    output_builder._OUTPUT_BUILDERS). Só recebe tarefas que não
+    submetem outras.
+    """
+    return ThreadPoolExecutor(max_workers=6, thread_name_prefix="tese-build")
@@ -0,0 +1,36 @@
+"""
+TESE V9 - Caminhos do projeto
+
+Resolve a raiz do projeto uma única vez (na importação) e expõe os
+caminhos padrão usados pelo engine:
+
+    PROJECT_ROOT / data / analysis_cache.json
+    PROJECT_ROOT / data / logs / tese.log
+
+Path.resolve() faz lookups reais no filesystem, então não vale a pena
+repeti-lo a cada chamada.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+DATA_DIR = PROJECT_ROOT / "data"
+LOGS_DIR = DATA_DIR / "logs"
+LOG_PATH = LOGS_DIR / "tese.log"
+CACHE_PATH = DATA_DIR / "analysis_cache.json"
+
+_INIT = False
+
+
+def ensure_data_dirs() -> None:
+    """
+    Cria data/ e data/logs/ na primeira chamada; depois é no-op.
+    """
+    global _INIT
+    if _INIT:
+        return
+    LOGS_DIR.mkdir(parents=True, exist_ok=True)
+    _INIT = True
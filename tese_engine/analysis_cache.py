@@ -30,15 +30,27 @@ from __future__ import annotations
 
 import hashlib
 import json
+import os
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Tuple, Optional
 
+from ._paths import CACHE_PATH, PROJECT_ROOT, ensure_data_dirs
+
+try:
+    import fcntl
+except ImportError:  # Windows: sem flock, segue sem lock
+    fcntl = None
+
 
 # Versão do pipeline – se mudar algo estrutural grande, podemos usar
 # para invalidar cache antigo manualmente.
 CACHE_VERSION = "v9.0.0"
 
+# O cache é regenerável, então por padrão não pagamos o custo de fsync
+# a cada escrita. Pode ser ligado se durabilidade for necessária.
+_FSYNC = False
+
 
 def _get_project_root() -> Path:
     """
@@ -46,14 +58,12 @@ def _get_project_root() -> Path:
         /Applications/TESE/TESE v9/investigation-system
     (assumindo que este arquivo está em tese_engine/)
     """
-    return Path(__file__).resolve().parents[1]
+    return PROJECT_ROOT
 
 
 def _get_cache_path() -> Path:
-    root = _get_project_root()
-    data_dir = root / "data"
-    data_dir.mkdir(parents=True, exist_ok=True)
-    return data_dir / "analysis_cache.json"
+    ensure_data_dirs()
+    return CACHE_PATH
 
 
 def _sha256_bytes(data: bytes) -> str:
@@ -119,10 +129,31 @@ def _load_cache_raw() -> Dict[str, Any]:
 
 
 def _save_cache_raw(cache: Dict[str, Any]) -> None:
+    """
+    Grava o cache de forma atômica:
+        - lock exclusivo em analysis_cache.json.lock (escritores concorrentes
+          esperam em vez de corromper o arquivo)
+        - escreve em analysis_cache.json.tmp
+        - os.replace(tmp, path)
+    Leitores nunca veem um JSON pela metade.
+    """
     path = _get_cache_path()
+    tmp_path = path.with_suffix(".json.tmp")
+    lock_path = path.with_suffix(".json.lock")
     try:
-        with path.open("w", encoding="utf-8") as f:
-            json.dump(cache, f, ensure_ascii=False)
+        with lock_path.open("w") as lock:
+            if fcntl is not None:
+                fcntl.flock(lock.fileno(), fcntl.LOCK_EX)
+            try:
+                with tmp_path.open("w", encoding="utf-8") as f:
+                    json.dump(cache, f, ensure_ascii=False)
+                    if _FSYNC:
+                        f.flush()
+                        os.fsync(f.fileno())
+                os.replace(tmp_path, path)
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock.fileno(), fcntl.LOCK_UN)
     except Exception:
         # Não podemos falhar a análise só por não conseguir salvar cache
         pass
@@ -22,15 +22,17 @@ duplicação gigante de dados.
 
 from __future__ import annotations
 
+import io
 import json
 import zipfile
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Optional
 
 from .json_exporter import (
     build_case_summary_payload,
-    build_messages_payload,
+    dump_json_array,
+    iter_messages_payload,
 )
 
 
@@ -85,9 +87,6 @@ def create_light_bundle(
 
     # Payloads
     summary_payload = build_case_summary_payload(analysis_data, mindmap=mindmap)
-    messages_payload: List[Dict[str, Any]] = []
-    if include_messages:
-        messages_payload = build_messages_payload(analysis_data)
 
     # Abre zip para escrita
     with zipfile.ZipFile(bundle_path, mode="w", compression=zipfile.ZIP_DEFLATED) as zf:
@@ -110,10 +109,10 @@ def create_light_bundle(
         )
 
         if include_messages:
-            zf.writestr(
-                "case/summary/messages.json",
-                json.dumps(messages_payload, ensure_ascii=False, indent=2),
-            )
+            # Escrita em streaming: mensagens vão direto para o zip
+            with zf.open("case/summary/messages.json", mode="w") as raw:
+                with io.TextIOWrapper(raw, encoding="utf-8") as fh:
+                    dump_json_array(iter_messages_payload(analysis_data), fh)
 
         # exports
         zf.writestr("case/exports/report.txt", report_text)
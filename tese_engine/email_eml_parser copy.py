@@ -28,114 +28,95 @@ from typing import Any, Dict, List
 Node = Dict[str, Any]
 
 
-def _make_node(
-    node_id: str,
-    label: str,
-    children: List[Node] | None = None,
-    collapsed: bool = True,
-    meta: Dict[str, Any] | None = None,
-) -> Node:
+def _leaf(node_id: str, label: str) -> Node:
     """
-    Helper para criar um nó de mindmap em formato padrão.
+    Nó-folha colapsado (children/meta próprios: o frontend pode mutar).
     """
     return {
         "id": node_id,
         "label": label,
-        "collapsed": collapsed,
-        "children": children or [],
-        "meta": meta or {},
+        "collapsed": True,
+        "children": [],
+        "meta": {},
     }
 
 
-def generate_mindmap(analysis_data: Dict[str, Any]) -> Dict[str, Any]:
+def _branch(node_id: str, label: str, children: List[Node]) -> Node:
     """
-    Gera uma estrutura de mindmap de alto nível a partir de analysis_data.
+    Nó expandido com filhos.
     """
-    if not isinstance(analysis_data, dict):
-        analysis_data = {}
+    return {
+        "id": node_id,
+        "label": label,
+        "collapsed": False,
+        "children": children,
+        "meta": {},
+    }
 
-    messages = analysis_data.get("messages", []) or []
-    patterns = analysis_data.get("patterns", {}) or {}
-    correlation = analysis_data.get("correlation", {}) or {}
-    risk_summary = analysis_data.get("risk_summary", {}) or {}
 
-    total_messages = len(messages)
+def generate_mindmap(analysis_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Gera uma estrutura de mindmap de alto nível a partir de analysis_data.
+    """
+    ad = analysis_data if isinstance(analysis_data, dict) else {}
+    get = ad.get
+
+    messages = get("messages") or []
+    patterns = get("patterns") or {}
+    correlation = get("correlation") or {}
+    risk_summary = get("risk_summary") or {}
+    timeline = get("timeline") or []
+
+    top_keywords = patterns.get("top_keywords") or ()
+    top_senders = patterns.get("top_senders") or ()
+    counts_by_platform = correlation.get("counts_by_platform") or {}
+    incident_counts = risk_summary.get("incident_counts") or {}
 
     case_title = (
-        analysis_data.get("case_title")
-        or analysis_data.get("case_name")
+        get("case_title")
+        or get("case_name")
         or "TESE Case Overview"
     )
 
     # Incident node
-    incident_counts = risk_summary.get("incident_counts") or {}
-    incidents_children: List[Node] = []
-
-    high = incident_counts.get("high", 0)
-    medium = incident_counts.get("medium", 0)
-    low = incident_counts.get("low", 0)
-
-    incidents_children.extend([
-        _make_node("incidents-high", f"High: {high}", collapsed=True),
-        _make_node("incidents-medium", f"Medium: {medium}", collapsed=True),
-        _make_node("incidents-low", f"Low: {low}", collapsed=True),
-    ])
-
-    incidents_node = _make_node(
+    incidents_node = _branch(
         "incidents",
         "Incidentes e Severidade",
-        children=incidents_children,
-        collapsed=False,
+        [
+            _leaf("incidents-high", f"High: {incident_counts.get('high', 0)}"),
+            _leaf("incidents-medium", f"Medium: {incident_counts.get('medium', 0)}"),
+            _leaf("incidents-low", f"Low: {incident_counts.get('low', 0)}"),
+        ],
     )
 
     # Patterns
     keyword_children = [
-        _make_node(f"keyword-{i}", f"{kw} ({count})", collapsed=True)
-        for i, (kw, count) in enumerate(patterns.get("top_keywords", []) or [])
+        _leaf(f"keyword-{i}", f"{kw} ({count})")
+        for i, (kw, count) in enumerate(top_keywords)
     ] or [
-        _make_node("keyword-none", "Nenhum padrão relevante detectado", collapsed=True)
+        _leaf("keyword-none", "Nenhum padrão relevante detectado")
     ]
-
-    patterns_node = _make_node(
-        "patterns",
-        "Padrões e Flags",
-        children=keyword_children,
-        collapsed=False,
-    )
+    patterns_node = _branch("patterns", "Padrões e Flags", keyword_children)
 
     # Senders
     sender_children = [
-        _make_node(f"sender-{i}", f"{sender} ({count} mensagens)", collapsed=True)
-        for i, (sender, count) in enumerate(patterns.get("top_senders", []) or [])
+        _leaf(f"sender-{i}", f"{sender} ({count} mensagens)")
+        for i, (sender, count) in enumerate(top_senders)
     ] or [
-        _make_node("sender-none", "Nenhum remetente-chave identificado", collapsed=True)
+        _leaf("sender-none", "Nenhum remetente-chave identificado")
     ]
-
-    senders_node = _make_node(
-        "senders",
-        "Entidades / Participantes",
-        children=sender_children,
-        collapsed=False,
-    )
+    senders_node = _branch("senders", "Entidades / Participantes", sender_children)
 
     # Platforms
-    counts_by_platform = correlation.get("counts_by_platform", {}) or {}
     platform_children = [
-        _make_node(f"platform-{i}", f"{platform}: {count} mensagens", collapsed=True)
+        _leaf(f"platform-{i}", f"{platform}: {count} mensagens")
         for i, (platform, count) in enumerate(counts_by_platform.items())
     ] or [
-        _make_node("platform-none", "Nenhum dado de plataforma", collapsed=True)
+        _leaf("platform-none", "Nenhum dado de plataforma")
     ]
-
-    platforms_node = _make_node(
-        "platforms",
-        "Plataformas e Canais",
-        children=platform_children,
-        collapsed=False,
-    )
+    platforms_node = _branch("platforms", "Plataformas e Canais", platform_children)
 
     # Timeline summary node
-    timeline = analysis_data.get("timeline", []) or []
     if timeline:
         first_ts = timeline[0].get("timestamp")
         last_ts = timeline[-1].get("timestamp")
@@ -143,30 +124,22 @@ def generate_mindmap(analysis_data: Dict[str, Any]) -> Dict[str, Any]:
     else:
         timeline_label = "Linha do Tempo (sem dados)"
 
-    timeline_node = _make_node(
-        "timeline",
-        timeline_label,
-        children=[],
-        collapsed=True,
-    )
-
-    root_children = [
-        senders_node,
-        patterns_node,
-        incidents_node,
-        platforms_node,
-        timeline_node,
-    ]
+    timeline_node = _leaf("timeline", timeline_label)
 
-    root_node = _make_node(
+    root_node = _branch(
         "root",
         case_title,
-        children=root_children,
-        collapsed=False,
+        [
+            senders_node,
+            patterns_node,
+            incidents_node,
+            platforms_node,
+            timeline_node,
+        ],
     )
 
     return {
         "title": case_title,
-        "subtitle": f"Based on {total_messages} sources",
+        "subtitle": f"Based on {len(messages)} sources",
         "root": root_node,
     }
@@ -7,8 +7,9 @@ Parses individual email files in EML format.
 
 import email
 from email import policy
-from datetime import datetime
-from typing import List, Dict
+from email.message import EmailMessage
+from email.utils import parsedate_to_datetime
+from typing import Dict, Iterator, List, Union
 
 
 class EmailEMLParser:
@@ -16,36 +17,65 @@ class EmailEMLParser:
     Basic parser for .eml email files.
     """
 
-    def parse(self, content: str) -> List[Dict]:
+    def _iter_text_parts(self, part: EmailMessage) -> Iterator[str]:
+        """
+        Yields the decoded text/plain bodies of a message part.
+
+        Inside multipart/alternative only the first text/plain
+        representation is used.
+        """
+        if part.get_content_maintype() == "message":
+            # message/rfc822 etc.: iter_parts() does not descend into
+            # these, the content is the embedded message
+            try:
+                inner = part.get_content()
+            except Exception:
+                return
+            if isinstance(inner, EmailMessage):
+                yield from self._iter_text_parts(inner)
+            return
+
+        if part.is_multipart():
+            alternative = part.get_content_subtype() == "alternative"
+            for sub in part.iter_parts():
+                found = False
+                for text in self._iter_text_parts(sub):
+                    found = True
+                    yield text
+                if found and alternative:
+                    return
+            return
+
+        if part.get_content_type() == "text/plain":
+            try:
+                yield part.get_content()
+            except Exception:
+                pass
+
+    def parse(self, content: Union[bytes, str]) -> List[Dict]:
         """
         Parse EML email file.
         
         Args:
-            content: EML file content
+            content: EML file content (raw bytes; str is still accepted)
             
         Returns:
             List with single message dictionary
         """
-        msg = email.message_from_string(content, policy=policy.default)
+        if isinstance(content, str):
+            content = content.encode("utf-8", "surrogateescape")
+
+        msg = email.message_from_bytes(content, policy=policy.default)
 
         ts = None
-        if msg.get("Date"):
+        date_header = msg.get("Date")
+        if date_header:
             try:
-                ts = datetime.strptime(msg.get("Date"), "%a, %d %b %Y %H:%M:%S %z")
-            except:
+                ts = parsedate_to_datetime(str(date_header))
+            except (TypeError, ValueError):
                 ts = None
 
-        body = ""
-        if msg.is_multipart():
-            for part in msg.walk():
-                if part.get_content_type() == "text/plain":
-                    try:
-                        body += part.get_content()
-                    except:
-                        pass
-        else:
-            if msg.get_content_type() == "text/plain":
-                body = msg.get_content()
+        body = "".join(self._iter_text_parts(msg))
 
         return [{
             "timestamp": ts,
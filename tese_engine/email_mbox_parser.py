@@ -6,8 +6,8 @@ Parses MBOX email archives.
 """
 
 import mailbox
-from datetime import datetime
-from typing import List, Dict
+from email.utils import parsedate_to_datetime
+from typing import Dict, Iterator, List
 
 
 class EmailMBOXParser:
@@ -15,6 +15,55 @@ class EmailMBOXParser:
     Basic parser for .mbox email archives.
     """
 
+    def iter_parse(self, file_path: str) -> Iterator[Dict]:
+        """
+        Parse MBOX email archive lazily, one message at a time.
+
+        Args:
+            file_path: Path to MBOX file
+
+        Yields:
+            Message dictionaries
+        """
+        mbox = mailbox.mbox(file_path, factory=None)
+        try:
+            for msg in mbox.itervalues():
+                ts = None
+                date_header = msg.get("Date")
+                if date_header:
+                    try:
+                        ts = parsedate_to_datetime(str(date_header))
+                    except (TypeError, ValueError):
+                        ts = None
+
+                body_parts: List[str] = []
+                if msg.is_multipart():
+                    for part in msg.walk():
+                        if part.get_content_type() == "text/plain":
+                            try:
+                                body_parts.append(
+                                    part.get_payload(decode=True).decode(errors="ignore")
+                                )
+                            except:
+                                pass
+                else:
+                    try:
+                        body_parts.append(
+                            msg.get_payload(decode=True).decode(errors="ignore")
+                        )
+                    except:
+                        pass
+
+                yield {
+                    "timestamp": ts,
+                    "sender": msg.get("From", "unknown"),
+                    "subject": msg.get("Subject", ""),
+                    "content": "".join(body_parts).strip(),
+                    "platform": "email"
+                }
+        finally:
+            mbox.close()
+
     def parse(self, file_path: str) -> List[Dict]:
         """
         Parse MBOX email archive.
@@ -25,38 +74,4 @@ class EmailMBOXParser:
         Returns:
             List of message dictionaries
         """
-        mbox = mailbox.mbox(file_path)
-        messages = []
-        
-        for msg in mbox:
-            ts = None
-            date_header = msg.get("Date")
-            if date_header:
-                try:
-                    ts = datetime.strptime(date_header, "%a, %d %b %Y %H:%M:%S %z")
-                except:
-                    ts = None
-
-            body = ""
-            if msg.is_multipart():
-                for part in msg.walk():
-                    if part.get_content_type() == "text/plain":
-                        try:
-                            body += part.get_payload(decode=True).decode(errors="ignore")
-                        except:
-                            pass
-            else:
-                try:
-                    body = msg.get_payload(decode=True).decode(errors="ignore")
-                except:
-                    body = ""
-
-            messages.append({
-                "timestamp": ts,
-                "sender": msg.get("From", "unknown"),
-                "subject": msg.get("Subject", ""),
-                "content": body.strip(),
-                "platform": "email"
-            })
-            
-        return messages
+        return list(self.iter_parse(file_path))
@@ -129,6 +129,50 @@ class IncidentFlagger:
 # Função funcional para TESE V9 - usada pelo engine_bridge
 # ---------------------------------------------------------------------------
 
+def flag_message(
+    m: Message,
+    flagger: IncidentFlagger,
+) -> Dict[str, Any]:
+    """
+    Avalia UMA mensagem (já copiada pelo chamador) e grava nela, in-place:
+        * flags -> lista de "gatilhos" / marcadores
+        * incident_analysis -> detalhes da avaliação
+
+    Retorna o dict de incident_analysis.
+    Usada por flag_incidents e pelo fused_pass do pattern_aggregator.
+    """
+    try:
+        inc_result = flagger.evaluate(m)
+    except Exception:
+        # Em caso de qualquer problema na avaliação, continua sem incidentes
+        inc_result = {
+            "incident": False,
+            "triggers": [],
+            "severity": "low",
+            "score": 0.0,
+        }
+
+    # Garante que exista lista de flags
+    existing_flags = m.get("flags")
+    if existing_flags is None:
+        flags_list: List[str] = []
+    elif isinstance(existing_flags, list):
+        flags_list = list(existing_flags)
+    else:
+        flags_list = [str(existing_flags)]
+
+    # Se houve incidente, adiciona os gatilhos como flags
+    if inc_result.get("incident"):
+        for trig in inc_result.get("triggers", []):
+            if trig not in flags_list:
+                flags_list.append(trig)
+
+    m["flags"] = flags_list
+    m["incident_analysis"] = inc_result
+
+    return inc_result
+
+
 def flag_incidents(messages: List[Message]) -> List[Message]:
     """
     Função de alto nível usada pela pipeline TESE V9:
@@ -162,35 +206,7 @@ def flag_incidents(messages: List[Message]) -> List[Message]:
         # Cópia rasa para não mutar o original
         m = dict(msg)
 
-        try:
-            inc_result = flagger.evaluate(m)
-        except Exception:
-            # Em caso de qualquer problema na avaliação, continua sem incidentes
-            inc_result = {
-                "incident": False,
-                "triggers": [],
-                "severity": "low",
-                "score": 0.0,
-            }
-
-        # Garante que exista lista de flags
-        existing_flags = m.get("flags")
-        if existing_flags is None:
-            flags_list: List[str] = []
-        elif isinstance(existing_flags, list):
-            flags_list = list(existing_flags)
-        else:
-            flags_list = [str(existing_flags)]
-
-        # Se houve incidente, adiciona os gatilhos como flags
-        if inc_result.get("incident"):
-            for trig in inc_result.get("triggers", []):
-                if trig not in flags_list:
-                    flags_list.append(trig)
-
-        m["flags"] = flags_list
-        m["incident_analysis"] = inc_result
-
+        flag_message(m, flagger)
         flagged.append(m)
 
     return flagged
@@ -18,12 +18,15 @@ Gera JSONs amigáveis para integrações e frontends:
 from __future__ import annotations
 
 import json
+import textwrap
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO
+
+from ._paths import PROJECT_ROOT
 
 
 def _get_project_root() -> Path:
-    return Path(__file__).resolve().parents[1]
+    return PROJECT_ROOT
 
 
 def _ensure_dir(path: Path) -> None:
@@ -75,34 +78,55 @@ def build_case_summary_payload(
     }
 
 
-def build_messages_payload(analysis_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+def iter_messages_payload(analysis_data: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
     """
-    Normaliza lista de mensagens para export (messages.json).
+    Normaliza mensagens para export (messages.json), uma de cada vez.
+
+    Gerador: permite serializar casos grandes sem montar uma lista
+    intermediária com todas as mensagens normalizadas.
     """
     if not isinstance(analysis_data, dict):
         analysis_data = {}
 
     messages = analysis_data.get("messages", []) or []
 
-    normalized: List[Dict[str, Any]] = []
+    _get = dict.get
     for i, m in enumerate(messages):
         if not isinstance(m, dict):
             continue
 
-        normalized.append(
-            {
-                "id": m.get("id") or m.get("message_id") or f"msg_{i}",
-                "platform": m.get("platform", "unknown"),
-                "timestamp": m.get("timestamp"),
-                "user": m.get("user") or m.get("sender"),
-                "text": m.get("text") or m.get("content", ""),
-                "flags": m.get("flags", []),
-                "scores": m.get("scores", {}),
-                "incident_analysis": m.get("incident_analysis", {}),
-            }
-        )
+        yield {
+            "id": _get(m, "id") or _get(m, "message_id") or f"msg_{i}",
+            "platform": _get(m, "platform", "unknown"),
+            "timestamp": _get(m, "timestamp"),
+            "user": _get(m, "sender") or _get(m, "user"),
+            "text": _get(m, "content") or _get(m, "text", ""),
+            "flags": _get(m, "flags", []),
+            "scores": _get(m, "scores", {}),
+            "incident_analysis": _get(m, "incident_analysis", {}),
+        }
+
+
+def build_messages_payload(analysis_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Normaliza lista de mensagens para export (messages.json).
+    """
+    return list(iter_messages_payload(analysis_data))
+
 
-    return normalized
+def dump_json_array(items: Iterable[Any], fp: TextIO) -> None:
+    """
+    Escreve um array JSON em `fp` item a item.
+
+    Produz o mesmo texto que json.dump(list(items), fp, ensure_ascii=False,
+    indent=2), sem materializar a lista inteira em memória.
+    """
+    first = True
+    for item in items:
+        fp.write("[\n" if first else ",\n")
+        first = False
+        fp.write(textwrap.indent(json.dumps(item, ensure_ascii=False, indent=2), "  "))
+    fp.write("[]" if first else "\n]")
 
 
 def export_case_summary_json(
@@ -128,7 +152,6 @@ def export_messages_json(
     Gera e salva messages.json no caminho indicado.
     """
     _ensure_dir(output_path)
-    payload = build_messages_payload(analysis_data)
     with output_path.open("w", encoding="utf-8") as f:
-        json.dump(payload, f, ensure_ascii=False, indent=2)
+        dump_json_array(iter_messages_payload(analysis_data), f)
     return output_path
@@ -8,23 +8,69 @@ para termos logs consistentes em:
 
 Formato:
     2025-11-19 10:12:30 [INFO] analysis_runner: mensagem...
+
+A escrita em disco não bloqueia quem loga: cada logger recebe um
+QueueHandler, e um único QueueListener (thread em background) repassa
+os registros para um FileHandler compartilhado.
 """
 
 from __future__ import annotations
 
+import atexit
 import logging
+import queue
+import threading
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
+from typing import Optional
+
+from ._paths import LOG_PATH, ensure_data_dirs
 
 
 _LOGGER_CACHE = {}
 
+# Fila compartilhada + listener único para todo o processo
+_QUEUE: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+_LISTENER: Optional[QueueListener] = None
+_LISTENER_LOCK = threading.Lock()
+
 
 def _get_logs_path() -> Path:
-    root = Path(__file__).resolve().parents[1]
-    data_dir = root / "data"
-    logs_dir = data_dir / "logs"
-    logs_dir.mkdir(parents=True, exist_ok=True)
-    return logs_dir / "tese.log"
+    ensure_data_dirs()
+    return LOG_PATH
+
+
+def _ensure_listener() -> None:
+    """
+    Cria (uma única vez) o FileHandler e o QueueListener
+    que escreve os registros da fila em disco.
+
+    Protegido por _LISTENER_LOCK: get_logger pode ser chamado ao mesmo
+    tempo de várias threads (executor do Studio) e só um listener pode
+    existir.
+    """
+    if _LISTENER is not None:
+        return
+
+    with _LISTENER_LOCK:
+        if _LISTENER is None:
+            _start_listener()
+
+
+def _start_listener() -> None:
+    global _LISTENER
+    fh = logging.FileHandler(_get_logs_path(), encoding="utf-8")
+    fh.setLevel(logging.INFO)
+
+    formatter = logging.Formatter(
+        "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
+    )
+    fh.setFormatter(formatter)
+
+    _LISTENER = QueueListener(_QUEUE, fh, respect_handler_level=True)
+    _LISTENER.start()
+    # Garante flush dos registros pendentes ao encerrar o processo
+    atexit.register(_LISTENER.stop)
 
 
 def get_logger(name: str) -> logging.Logger:
@@ -40,16 +86,8 @@ def get_logger(name: str) -> logging.Logger:
 
     # Evita handlers duplicados se get_logger for chamado mais de uma vez
     if not logger.handlers:
-        log_path = _get_logs_path()
-        fh = logging.FileHandler(log_path, encoding="utf-8")
-        fh.setLevel(logging.INFO)
-
-        formatter = logging.Formatter(
-            "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
-        )
-        fh.setFormatter(formatter)
-
-        logger.addHandler(fh)
+        _ensure_listener()
+        logger.addHandler(QueueHandler(_QUEUE))
 
     _LOGGER_CACHE[name] = logger
     return logger
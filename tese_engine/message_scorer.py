@@ -12,10 +12,24 @@ Objetivo:
 from typing import List, Dict, Any
 
 
+# Scores neutros usados enquanto não há modelo de IA conectado.
+#
+# ATENÇÃO: este dict é COMPARTILHADO por todas as mensagens que recebem
+# o default (evita alocar um dict novo por mensagem). Trate-o como
+# somente-leitura; quem precisar alterar scores deve atribuir um dict
+# novo em msg["scores"]. "flags" é uma tupla vazia (imutável), que
+# serializa em JSON como [] — igual ao formato anterior.
+NEUTRAL_SCORES: Dict[str, Any] = {
+    "risk": 0.0,
+    "sentiment": "neutral",
+    "flags": (),
+}
+
+
 def score_messages(messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """
     Recebe uma lista de mensagens normalizadas e devolve a MESMA lista,
-    adicionando um campo "scores" neutro em cada mensagem.
+    adicionando (in-place) um campo "scores" neutro em cada mensagem.
 
     Formato esperado de cada mensagem de entrada (flexível):
         {
@@ -27,27 +41,13 @@ def score_messages(messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         }
 
     Saída:
-        mesma lista, mas com:
-        msg["scores"] = {
-            "risk": 0.0,
-            "sentiment": "neutral",
-            "flags": [],
-        }
+        a própria lista de entrada, com:
+        msg["scores"] = NEUTRAL_SCORES  (compartilhado, somente-leitura)
+        Mensagens que já têm "scores" não são alteradas; entradas
+        não-dict são ignoradas.
     """
-    scored: List[Dict[str, Any]] = []
-
     for msg in messages:
-        # cópia rasa pra não mexer no objeto original por referência
-        m = dict(msg)
-
-        # se já tiver scores (no futuro), não sobrescreve
-        if "scores" not in m:
-            m["scores"] = {
-                "risk": 0.0,
-                "sentiment": "neutral",
-                "flags": [],
-            }
-
-        scored.append(m)
+        if isinstance(msg, dict):
+            msg.setdefault("scores", NEUTRAL_SCORES)
 
-    return scored
+    return messages
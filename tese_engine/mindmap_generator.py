@@ -124,10 +124,11 @@ def generate_mindmap(analysis_data: Dict[str, Any]) -> Dict[str, Any]:
     # ------------------------------------------------------------------
     # 3) Platforms (agregado a partir das mensagens)
     # ------------------------------------------------------------------
-    platform_counter = Counter()
-    for msg in messages:
-        platform = msg.get("platform") or msg.get("source") or "unknown"
-        platform_counter[platform] += 1
+    # Extrai a "coluna" de plataformas e conta em uma única chamada:
+    # Counter(iterable) roda o laço de contagem em C.
+    platform_counter = Counter(
+        [msg.get("platform") or msg.get("source") or "unknown" for msg in messages]
+    )
 
     platform_children: List[Dict[str, Any]] = [
         {
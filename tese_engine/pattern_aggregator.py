@@ -8,12 +8,17 @@ Responsabilidade:
 
 Compatibilidade:
     - Mantém a classe PatternAggregator (estilo TESE V8).
-    - Adiciona a função aggregate_patterns(messages) (estilo TESE V9),
-      usada pelo engine_bridge.run_full_analysis.
+    - Adiciona a função aggregate_patterns(messages) (estilo TESE V9).
+    - Adiciona fused_pass(messages), usada pelo engine_bridge.run_full_analysis:
+      scoring + flagging + agregação + contagens em uma única passada.
 """
 
-from collections import defaultdict
-from typing import Dict, List, Any
+from collections import Counter
+from itertools import chain
+from typing import Dict, List, Any, Tuple
+
+from .incident_flagger import IncidentFlagger, flag_message
+from .message_scorer import NEUTRAL_SCORES
 
 
 Message = Dict[str, Any]
@@ -26,9 +31,9 @@ class PatternAggregator:
 
     def __init__(self) -> None:
         # Contagem de palavras-chave/flags
-        self.keyword_counts = defaultdict(int)
+        self.keyword_counts = Counter()
         # Contagem de remetentes/usuários
-        self.sender_counts = defaultdict(int)
+        self.sender_counts = Counter()
 
     def _get_sender(self, msg: Message) -> str:
         """
@@ -58,26 +63,31 @@ class PatternAggregator:
                     "top_keywords": [(keyword, count), ...],
                 }
         """
-        for msg in messages:
-            if not isinstance(msg, dict):
-                continue
+        dict_msgs = [msg for msg in messages if isinstance(msg, dict)]
 
-            sender = self._get_sender(msg)
-            self.sender_counts[sender] += 1
+        # Counter.update sobre iteráveis: o laço de incremento roda em C.
+        # Mesmo critério de _get_sender, inline para evitar a chamada.
+        self.sender_counts.update(
+            str(msg.get("sender") or msg.get("user", "unknown"))
+            for msg in dict_msgs
+        )
 
-            flags = msg.get("flags") or []
-            if not isinstance(flags, list):
-                flags = [flags]
+        # Flags achatadas (flag isolada vira lista de um elemento)
+        self.keyword_counts.update(map(str, chain.from_iterable(
+            flags if isinstance(flags, list) else [flags]
+            for flags in (msg.get("flags") or [] for msg in dict_msgs)
+        )))
 
-            for flag in flags:
-                self.keyword_counts[str(flag)] += 1
+        return self.summarize()
 
-        top_senders = sorted(
-            self.sender_counts.items(), key=lambda x: -x[1]
-        )[:5]
-        top_keywords = sorted(
-            self.keyword_counts.items(), key=lambda x: -x[1]
-        )[:5]
+    def summarize(self) -> Dict[str, Any]:
+        """
+        Monta o resumo (top 5 remetentes / flags) a partir das contagens atuais.
+        """
+        # most_common(k) usa heapq.nlargest: O(n log k) em vez de ordenar
+        # tudo; empates mantêm a ordem de inserção, igual ao sorted(...)[:5].
+        top_senders = self.sender_counts.most_common(5)
+        top_keywords = self.keyword_counts.most_common(5)
 
         return {
             "top_senders": top_senders,
@@ -113,3 +123,88 @@ def aggregate_patterns(messages: List[Message]) -> Dict[str, Any]:
     except Exception:
         # Fallback extremamente defensivo
         return {"top_senders": [], "top_keywords": []}
+
+
+# ---------------------------------------------------------------------------
+# Passada única (scoring + flagging + agregação + contagens)
+# ---------------------------------------------------------------------------
+
+def fused_pass(
+    messages: List[Message],
+) -> Tuple[List[Message], Dict[str, Any], Dict[str, int], Dict[str, int]]:
+    """
+    Substitui, em UMA passada sobre as mensagens, a sequência:
+
+        scored = score_messages(messages)
+        flagged = flag_incidents(scored)
+        patterns = aggregate_patterns(flagged)
+        + contagem por plataforma (correlate_platforms)
+        + contagem por severidade (orchestrate_risk)
+
+    Cada mensagem é copiada uma única vez (em vez de uma cópia no scorer e
+    outra no flagger); scores e flags são gravados na cópia.
+
+    Retorna:
+        (flagged_messages, patterns, platform_counts, severity_counts)
+
+        severity_counts sempre tem as chaves "high", "medium" e "low".
+
+    Como em aggregate_patterns, a agregação de padrões não levanta
+    exceções: se falhar (em qualquer mensagem ou no summarize), patterns
+    volta vazio e o restante da passada segue normalmente.
+    """
+    if not isinstance(messages, list):
+        return [], {"top_senders": [], "top_keywords": []}, {}, {"high": 0, "medium": 0, "low": 0}
+
+    flagger = IncidentFlagger()
+    aggregator = PatternAggregator()
+    str_ = str
+    sender_counts = aggregator.sender_counts
+    keyword_counts = aggregator.keyword_counts
+
+    flagged: List[Message] = []
+    platform_counts: Dict[str, int] = {}
+    severity_counts = {"high": 0, "medium": 0, "low": 0}
+    patterns_ok = True
+
+    for msg in messages:
+        if not isinstance(msg, dict):
+            continue
+
+        m = dict(msg)
+
+        # scoring (message_scorer)
+        m.setdefault("scores", NEUTRAL_SCORES)
+
+        # flagging (incident_flagger)
+        inc_result = flag_message(m, flagger)
+        flagged.append(m)
+
+        # padrões (PatternAggregator)
+        if patterns_ok:
+            try:
+                sender_counts[str_(m.get("sender") or m.get("user", "unknown"))] += 1
+                for flag in m["flags"]:
+                    keyword_counts[str_(flag)] += 1
+            except Exception:
+                # Fallback extremamente defensivo (igual a aggregate_patterns)
+                patterns_ok = False
+
+        # contagem por plataforma (correlate_platforms)
+        platform = m.get("platform", "unknown")
+        platform_counts[platform] = platform_counts.get(platform, 0) + 1
+
+        # contagem por severidade (orchestrate_risk)
+        severity = inc_result.get("severity") or "low"
+        if severity not in ("high", "medium"):
+            severity = "low"
+        severity_counts[severity] += 1
+
+    patterns = {"top_senders": [], "top_keywords": []}
+    if patterns_ok:
+        try:
+            patterns = aggregator.summarize()
+        except Exception:
+            pass
+
+    return flagged, patterns, platform_counts, severity_counts
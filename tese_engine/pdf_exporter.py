@@ -19,25 +19,44 @@ Recomendado:
 
 from __future__ import annotations
 
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Callable, Dict, Iterable, Iterator, Union
+
+# Checagem de disponibilidade feita uma vez, no import do módulo
+try:
+    from reportlab.lib.pagesizes import A4
+    from reportlab.pdfgen import canvas
+except ImportError:  # reportlab não instalado → fallback em texto
+    A4 = None
+    canvas = None
+
+_HAS_REPORTLAB = canvas is not None
+
+# Texto do relatório: string única ou função sem argumentos que gera as
+# linhas (sem "\n"), ex.: lambda: generate_report_lines(analysis_data).
+# A função é chamada de novo se o fallback em texto precisar das linhas.
+ReportText = Union[str, Callable[[], Iterable[str]]]
 
 
 def _ensure_parent(path: Path) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
 
 
+def _iter_lines(report_text: ReportText) -> Iterator[str]:
+    if isinstance(report_text, str):
+        return iter(report_text.splitlines())
+    return iter(report_text())
+
+
 def _export_with_reportlab(
     analysis_data: Dict[str, Any],
-    report_text: str,
+    report_text: ReportText,
     output_path: Path,
 ) -> Path:
     """
     Gera PDF usando reportlab.
     """
-    from reportlab.lib.pagesizes import A4
-    from reportlab.pdfgen import canvas
-
     _ensure_parent(output_path)
 
     c = canvas.Canvas(str(output_path), pagesize=A4)
@@ -55,23 +74,34 @@ def _export_with_reportlab(
     c.drawString(72, height - 92, f"Total messages analysed: {total_messages}")
 
     # Corpo: texto do relatório (quebrando em linhas)
-    text_obj = c.beginText()
-    text_obj.setFont("Helvetica", 9)
-    text_obj.setTextOrigin(72, height - 120)
-
-    # Quebra o report_text em linhas
-    for line in report_text.splitlines():
-        text_obj.textLine(line)
-        # Se chegar muito perto do fim da página, cria nova
-        if text_obj.getY() < 72:
-            c.drawText(text_obj)
-            c.showPage()
-            text_obj = c.beginText()
-            text_obj.setFont("Helvetica", 9)
-            text_obj.setTextOrigin(72, height - 72)
-
-    c.drawText(text_obj)
-    c.showPage()
+    # Em vez de consultar getY() a cada linha, calcula de antemão quantas
+    # linhas cabem em cada página (mesma paginação: quebra abaixo de y=72)
+    # e consome as linhas página a página: só uma página fica em memória e
+    # showPage() é chamado só nas fronteiras de página.
+    font_size = 9
+    leading = font_size * 1.2  # leading padrão do reportlab
+    first_lpp = int((height - 120 - 72) / leading) + 1
+    lpp = int((height - 144) / leading) + 1
+
+    lines = _iter_lines(report_text)
+    page = list(islice(lines, first_lpp))
+    top_y = height - 120
+
+    while True:
+        text_obj = c.beginText()
+        text_obj.setFont("Helvetica", font_size)
+        text_obj.setTextOrigin(72, top_y)
+        text_line = text_obj.textLine
+        for line in page:
+            text_line(line)
+        c.drawText(text_obj)
+        c.showPage()
+
+        page = list(islice(lines, lpp))
+        if not page:
+            break
+        top_y = height - 72
+
     c.save()
 
     return output_path
@@ -79,7 +109,7 @@ def _export_with_reportlab(
 
 def _export_plaintext_fallback(
     analysis_data: Dict[str, Any],
-    report_text: str,
+    report_text: ReportText,
     output_path: Path,
 ) -> Path:
     """
@@ -96,16 +126,24 @@ def _export_plaintext_fallback(
     total_messages = len(messages)
     meta = f"Total messages analysed: {total_messages}\n\n"
 
-    content = header + meta + report_text
-
-    # Escreve como texto bruto
-    output_path.write_text(content, encoding="utf-8")
+    # Escreve como texto bruto, incrementalmente
+    with output_path.open("w", encoding="utf-8") as f:
+        f.write(header + meta)
+        if isinstance(report_text, str):
+            f.write(report_text)
+        else:
+            # Mesmo conteúdo de "\n".join(linhas), sem montar a string
+            lines = _iter_lines(report_text)
+            for line in lines:
+                f.write(line)
+                break
+            f.writelines("\n" + line for line in lines)
     return output_path
 
 
 def export_to_pdf(
     analysis_data: Dict[str, Any],
-    report_text: str,
+    report_text: ReportText,
     output_path: Path,
 ) -> Path:
     """
@@ -113,19 +151,24 @@ def export_to_pdf(
 
     Parâmetros:
         analysis_data: dict retornado por run_full_analysis
-        report_text: texto gerado por report_generator.generate_report
+        report_text: texto gerado por report_generator.generate_report, ou
+            uma função sem argumentos que devolve as linhas
+            (ex.: lambda: generate_report_lines(analysis_data)), consumidas
+            em streaming
         output_path: Path onde o PDF será salvo
 
     Retorna:
         Path final do PDF.
 
     OBS: se reportlab não estiver instalado, usa fallback em texto.
+    Com uma função de linhas, o fallback a chama de novo (as linhas não
+    ficam guardadas em memória).
     """
-    try:
-        # Tenta usar reportlab
-        import reportlab  # noqa: F401
-
-        return _export_with_reportlab(analysis_data, report_text, output_path)
-    except Exception:
-        # Qualquer problema → fallback em texto (não quebra o app)
-        return _export_plaintext_fallback(analysis_data, report_text, output_path)
+    if _HAS_REPORTLAB:
+        try:
+            return _export_with_reportlab(analysis_data, report_text, output_path)
+        except Exception:
+            # Qualquer problema → fallback em texto (não quebra o app)
+            pass
+
+    return _export_plaintext_fallback(analysis_data, report_text, output_path)
@@ -9,7 +9,8 @@ Compatibilidade:
 """
 
 from datetime import datetime
-from typing import Dict, List, Any
+from operator import itemgetter
+from typing import Dict, Iterable, List, Any, Optional, Tuple
 
 
 Message = Dict[str, Any]
@@ -24,6 +25,9 @@ class PlatformCorrelator:
         # Mapeamento opcional para alias de usuários.
         # Pode ser expandido no futuro.
         self.aliases = {}
+        # Cache remetente bruto -> str(...).lower().strip(). Os aliases são
+        # aplicados depois, então alterar self.aliases não invalida o cache.
+        self._norm_cache: Dict[Any, str] = {}
 
     def normalize_sender(self, sender: str) -> str:
         """
@@ -31,55 +35,83 @@ class PlatformCorrelator:
         """
         if not sender:
             return "unknown"
-        sender = str(sender).lower().strip()
-        return self.aliases.get(sender, sender)
+        try:
+            normalized = self._norm_cache[sender]
+        except KeyError:
+            normalized = self._norm_cache[sender] = str(sender).lower().strip()
+        except TypeError:
+            # Remetente não-hashable (ex.: lista): normaliza sem cache
+            normalized = str(sender).lower().strip()
+        return self.aliases.get(normalized, normalized)
 
     def correlate(self, platform_messages: Dict[str, List[Dict]]) -> List[Dict]:
         """
         Merges messages from multiple platforms into a single
         time-ordered list of normalized messages.
         """
-        merged = []
-
-        for platform, msgs in platform_messages.items():
-            if not isinstance(msgs, list):
-                continue
+        return self.merge(
+            (platform, m)
+            for platform, msgs in platform_messages.items()
+            if isinstance(msgs, list)
+            for m in msgs
+        )
+
+    def merge(self, tagged_messages: Iterable[Tuple[Any, Dict]]) -> List[Dict]:
+        """
+        Same as correlate(), but takes a flat iterable of (platform, message)
+        pairs, so callers do not need to regroup a flat message list into a
+        dict-of-lists first.
 
-            for m in msgs:
-                merged.append({
+        Ordering matches correlate(): by timestamp, and for equal timestamps
+        by platform (in order of first appearance), then by input order.
+        """
+        platform_rank: Dict[Any, int] = {}
+        rank_of = platform_rank.setdefault
+        normalize = self.normalize_sender
+        min_ts = datetime.min
+
+        # Lista montada numa única list comprehension. A chave de ordenação
+        # (timestamp ausente -> datetime.min) é calculada aqui; o timestamp
+        # da mensagem não é alterado.
+        merged = [
+            (
+                (ts := m.get("timestamp")) or min_ts,
+                rank_of(platform, len(platform_rank)),
+                {
                     "platform": platform,
-                    "timestamp": m.get("timestamp"),
-                    "sender": self.normalize_sender(m.get("sender") or m.get("user")),
+                    "timestamp": ts,
+                    "sender": normalize(m.get("sender") or m.get("user")),
                     "content": m.get("content") or m.get("text", ""),
                     "score": m.get("score", 0),
                     "flags": m.get("flags", []),
-                })
-
-        # Ordenação temporal – tolerante a timestamps ausentes
-        def sort_key(msg):
-            ts = msg.get("timestamp")
-            try:
-                return ts or datetime.min
-            except Exception:
-                return datetime.min
+                },
+            )
+            for platform, m in tagged_messages
+        ]
 
-        merged.sort(key=sort_key)
-        return merged
+        # Ordenação temporal (estável) com chave em C, sem closure por item
+        merged.sort(key=itemgetter(0, 1))
+        return [msg for _ts, _rank, msg in merged]
 
 
 # ---------------------------------------------------------------------------
 # Função funcional TESE V9
 # ---------------------------------------------------------------------------
 
-def correlate_platforms(messages: List[Message]) -> Dict[str, Any]:
+def correlate_platforms(
+    messages: List[Message],
+    counts_by_platform: Optional[Dict[str, int]] = None,
+) -> Dict[str, Any]:
     """
     TESE V9 expected API:
         correlated = correlate_platforms(flagged_messages)
 
     Responsabilidades:
-        - Agrupar mensagens por plataforma.
-        - Chamar o correlator V8.
+        - Chamar o correlator V8 (PlatformCorrelator.merge) sobre a lista plana.
+        - Contar mensagens por plataforma.
         - Devolver resumo estruturado para o upstream (engine_bridge).
+        - Reaproveitar `counts_by_platform` quando já vier calculado
+          (pattern_aggregator.fused_pass).
 
     Formato de retorno:
         {
@@ -91,33 +123,34 @@ def correlate_platforms(messages: List[Message]) -> Dict[str, Any]:
     if not isinstance(messages, list):
         return {"merged": [], "counts_by_platform": {}, "unique_senders": []}
 
-    # Agrupamento V9 -> V8
-    grouped: Dict[str, List[Message]] = {}
+    # Chamada do motor V8 direto sobre a lista plana (sem reagrupar em
+    # dict-of-lists só para achatar de novo dentro do correlator)
+    tagged = [
+        (m.get("platform", "unknown"), m)
+        for m in messages
+        if isinstance(m, dict)
+    ]
 
-    for m in messages:
-        if not isinstance(m, dict):
-            continue
-
-        platform = m.get("platform", "unknown")
-        grouped.setdefault(platform, []).append(m)
-
-    # Chamada do motor V8
     correlator = PlatformCorrelator()
 
     try:
-        merged = correlator.correlate(grouped)
+        merged = correlator.merge(tagged)
     except Exception:
         merged = []
 
     # Estatísticas simples (úteis para o relatório)
-    counts_by_platform = {
-        platform: len(msgs) for platform, msgs in grouped.items()
-    }
-
-    senders = sorted({
-        msg.get("sender") or msg.get("user") or "unknown"
-        for msg in merged
-    })
+    if counts_by_platform is None:
+        counts_by_platform = {}
+        for platform, _m in tagged:
+            counts_by_platform[platform] = counts_by_platform.get(platform, 0) + 1
+
+    # merge() sempre grava "sender" já normalizado (str), então basta
+    # deduplicar com map/itemgetter em C; só o vazio vira "unknown".
+    senders = set(map(itemgetter("sender"), merged))
+    if "" in senders:
+        senders.discard("")
+        senders.add("unknown")
+    senders = sorted(senders)
 
     return {
         "merged": merged,
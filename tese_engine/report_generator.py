@@ -10,7 +10,7 @@ Compatibilidade:
       usada por engine_bridge.create_report.
 """
 
-from typing import Dict, Any
+from typing import Any, Dict, Iterator
 
 
 class ReportGenerator:
@@ -35,47 +35,55 @@ class ReportGenerator:
         Returns:
             Formatted report string.
         """
+        return "\n".join(self.generate_summary_lines(analysis))
+
+    def generate_summary_lines(self, analysis: Dict[str, Any]) -> Iterator[str]:
+        """
+        Same report as generate_summary(), yielded one line at a time
+        (without trailing newlines), so exporters can stream it to disk
+        without holding the whole text in memory.
+        """
         messages = analysis.get("messages", []) or []
         patterns = analysis.get("patterns", {}) or {}
         risk_summary = analysis.get("risk_summary", {}) or {}
 
         total_messages = len(messages)
 
-        summary_lines = [
-            "TESE FORENSIC REPORT",
-            "=====================",
-            f"Total Messages Analysed: {total_messages}",
-            "",
-        ]
+        yield "TESE FORENSIC REPORT"
+        yield "====================="
+        yield f"Total Messages Analysed: {total_messages}"
+        yield ""
 
         # --- Incident counts (se vierem do orchestrate_risk) ---
         incident_counts = risk_summary.get("incident_counts", {})
         if incident_counts:
-            summary_lines.append("Incident Severity Breakdown:")
+            yield "Incident Severity Breakdown:"
             for level in ("high", "medium", "low"):
-                count = incident_counts.get(level, 0)
-                summary_lines.append(f"- {level.capitalize()}: {count}")
-            summary_lines.append("")
+                yield f"- {level.capitalize()}: {incident_counts.get(level, 0)}"
+            yield ""
 
         # --- Top keywords / flags ---
-        summary_lines.append("Top Keywords / Flags:")
-        for kw, count in patterns.get("top_keywords", []):
-            summary_lines.append(f"- {kw}: {count} occurrences")
-        if not patterns.get("top_keywords"):
-            summary_lines.append("- (none detected)")
-        summary_lines.append("")
+        top_keywords = patterns.get("top_keywords") or ()
+        yield "Top Keywords / Flags:"
+        if top_keywords:
+            for kw, count in top_keywords:
+                yield f"- {kw}: {count} occurrences"
+        else:
+            yield "- (none detected)"
+        yield ""
 
         # --- Top senders ---
-        summary_lines.append("Top Senders / Users:")
-        for sender, count in patterns.get("top_senders", []):
-            summary_lines.append(f"- {sender}: {count} messages")
-        if not patterns.get("top_senders"):
-            summary_lines.append("- (none detected)")
-        summary_lines.append("")
+        top_senders = patterns.get("top_senders") or ()
+        yield "Top Senders / Users:"
+        if top_senders:
+            for sender, count in top_senders:
+                yield f"- {sender}: {count} messages"
+        else:
+            yield "- (none detected)"
+        yield ""
 
         # --- Optional final note ---
-        summary_lines.append("End of TESE report.")
-        return "\n".join(summary_lines)
+        yield "End of TESE report."
 
 
 # ---------------------------------------------------------------------------
@@ -105,3 +113,18 @@ def generate_report(analysis_data: Dict[str, Any]) -> str:
     except Exception as e:
         # Fallback extremamente defensivo para nunca quebrar o app
         return f"TESE report could not be generated due to an internal error: {e}"
+
+
+def generate_report_lines(analysis_data: Dict[str, Any]) -> Iterator[str]:
+    """
+    Versão em streaming de generate_report: devolve um iterador de linhas
+    (sem "\n"). Para o pdf_exporter.export_to_pdf, passe
+    lambda: generate_report_lines(analysis_data).
+
+    Diferente de generate_report, erros durante a geração propagam para o
+    chamador (não há como "trocar" o texto no meio do streaming).
+    """
+    if not isinstance(analysis_data, dict):
+        analysis_data = {}
+
+    return ReportGenerator().generate_summary_lines(analysis_data)
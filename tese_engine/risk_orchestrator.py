@@ -7,11 +7,15 @@ Compatibilidade:
     - Adiciona função orchestrate_risk(...) (V9) esperada pelo engine_bridge.
 """
 
-from typing import Dict, List, Any
+from collections import Counter
+from typing import Dict, List, Any, Optional
 
 
 Message = Dict[str, Any]
 
+# Default compartilhado para mensagens sem incident_analysis (somente leitura).
+_EMPTY: Dict[str, Any] = {}
+
 
 class RiskOrchestrator:
     """
@@ -58,7 +62,8 @@ def orchestrate_risk(
     flagged_messages: List[Message],
     pattern_data: Dict[str, Any],
     correlation_data: Dict[str, Any],
-    timeline_data: List[Message]
+    timeline_data: List[Message],
+    severity_counts: Optional[Dict[str, int]] = None,
 ) -> Dict[str, Any]:
     """
     TESE V9 expected API:
@@ -76,6 +81,9 @@ def orchestrate_risk(
         - This wrapper does NOT use the V8 RiskOrchestrator.process_messages(),
           because V9 pipeline already performed scoring/flagging/aggregation.
         - Instead, this summarizes final risk signals.
+        - If `severity_counts` ({"high", "medium", "low"}) was already
+          computed upstream (pattern_aggregator.fused_pass), the severity
+          loop over flagged_messages is skipped.
 
     Returns:
         Dictionary with risk summary structure.
@@ -83,22 +91,20 @@ def orchestrate_risk(
 
     risk_summary = {}
 
-    # Count high-severity incidents
-    high = 0
-    medium = 0
-    low = 0
-
-    for msg in flagged_messages:
-        severity = (
-            msg.get("incident_analysis", {}).get("severity")
-            or "low"
+    if severity_counts is not None:
+        high = severity_counts.get("high", 0)
+        medium = severity_counts.get("medium", 0)
+        low = severity_counts.get("low", 0)
+    else:
+        # Count incidents by severity (one pass, no per-message {} default)
+        sev_counts = Counter(
+            msg.get("incident_analysis", _EMPTY).get("severity")
+            for msg in flagged_messages
         )
-        if severity == "high":
-            high += 1
-        elif severity == "medium":
-            medium += 1
-        else:
-            low += 1
+        high = sev_counts["high"]
+        medium = sev_counts["medium"]
+        # Qualquer outra severidade (inclusive ausente) conta como "low".
+        low = len(flagged_messages) - high - medium
 
     # High-level summary dictionary
     risk_summary["incident_counts"] = {
@@ -6,8 +6,47 @@ Supports JSON-structured exports and TXT fallback.
 """
 
 import json
+import re
 from datetime import datetime
-from typing import List, Dict
+from typing import Any, Dict, Iterable, List, Optional
+
+
+# Uma linha de export TXT: "[<timestamp>] <sender>: <content>".
+# Mesma semântica do split anterior: timestamp até o primeiro "] ",
+# sender até o primeiro ": ", resto é conteúdo. O "\r?" final absorve
+# quebras de linha Windows (\r\n).
+_LINE_RE = re.compile(r"^(.*?)\] (.*?): (.*?)\r?$", re.MULTILINE)
+
+# Início de um documento JSON objeto/array (só o whitespace que o JSON
+# aceita antes do primeiro caractere). Sem isso, um TXT grande seria
+# varrido pelo json.loads inteiro só para falhar.
+_JSON_HEAD_RE = re.compile(r"[ \t\n\r]*[\[{]")
+
+
+def _to_datetimes(values: Iterable[Any]) -> List[Optional[datetime]]:
+    """
+    Converte uma coluna de timestamps ISO em datetimes, de uma vez.
+
+    Cada valor distinto é parseado uma única vez (exports de chat repetem
+    muito o mesmo timestamp); valores inválidos viram None.
+    """
+    cache: Dict[Any, Optional[datetime]] = {}
+    out: List[Optional[datetime]] = []
+    append = out.append
+    for value in values:
+        try:
+            ts = cache[value]
+        except KeyError:
+            try:
+                ts = datetime.fromisoformat(value)
+            except (TypeError, ValueError):
+                ts = None
+            cache[value] = ts
+        except TypeError:
+            # valor não-hashable: sem cache, e não é string ISO
+            ts = None
+        append(ts)
+    return out
 
 
 class SkypeParser:
@@ -26,46 +65,47 @@ class SkypeParser:
         Returns:
             List of message dictionaries
         """
-        try:
-            data = json.loads(content)
-            return self._parse_json(data)
-        except:
-            return self._parse_txt(content)
+        if _JSON_HEAD_RE.match(content):
+            try:
+                return self._parse_json(json.loads(content))
+            except (json.JSONDecodeError, AttributeError, TypeError):
+                # JSON inválido, ou válido mas fora do formato esperado
+                # (ex.: lista no topo) → cai no parser TXT, como antes
+                pass
+        return self._parse_txt(content)
 
     def _parse_json(self, data: Dict) -> List[Dict]:
         """Parse JSON-formatted Skype export."""
-        messages = []
-        for msg in data.get("messages", []):
-            ts = None
-            if "originalarrivaltime" in msg:
-                try:
-                    ts = datetime.fromisoformat(msg["originalarrivaltime"])
-                except:
-                    ts = None
-            messages.append({
+        msgs = data.get("messages", [])
+        timestamps = _to_datetimes(msg.get("originalarrivaltime") for msg in msgs)
+        return [
+            {
                 "timestamp": ts,
                 "sender": msg.get("from", "unknown"),
                 "content": msg.get("content", ""),
                 "platform": "skype"
-            })
-        return messages
+            }
+            for msg, ts in zip(msgs, timestamps)
+        ]
 
     def _parse_txt(self, text: str) -> List[Dict]:
         """Parse TXT-formatted Skype export."""
-        messages = []
-        for line in text.splitlines():
-            if ":" in line:
-                try:
-                    ts_str, rest = line.split("] ", 1)
-                    ts_str = ts_str.replace("[", "")
-                    ts = datetime.fromisoformat(ts_str)
-                    sender, content = rest.split(": ", 1)
-                except:
-                    continue
-                messages.append({
-                    "timestamp": ts,
-                    "sender": sender,
-                    "content": content,
-                    "platform": "skype"
-                })
-        return messages
+        # findall devolve as tuplas (ts, sender, content) direto em C, sem
+        # criar um objeto Match por linha.
+        rows = [
+            (ts_str.replace("[", ""), sender, content)
+            for ts_str, sender, content in _LINE_RE.findall(text)
+        ]
+
+        timestamps = _to_datetimes(row[0] for row in rows)
+        return [
+            {
+                "timestamp": ts,
+                "sender": sender,
+                "content": content,
+                "platform": "skype"
+            }
+            for (_ts_str, sender, content), ts in zip(rows, timestamps)
+            # linhas com timestamp inválido são descartadas (como antes)
+            if ts is not None
+        ]
@@ -20,16 +20,20 @@ Each message is a dict with at least:
     {
         "platform": "slack",
         "message_id": str,
-        "user": str or None,
+        "sender": str or None,  # Slack user name
         "user_id": str or None,
         "channel": str or None,
-        "text": str,
+        "content": str,         # message text
         "timestamp": str,  # ISO-8601 when possible, otherwise original
         "raw": dict or str  # original row/object/line
     }
 
+"sender"/"content" are the canonical keys every TESE parser emits. Readers
+that may still see older dicts with the Slack-native "user"/"text" keys
+(cached analyses, hand-made input) map them where they read the message.
+
 This should be compatible with a generic TESE engine pipeline that expects:
-- a "text" field for content,
+- a "content" field for content,
 - a "timestamp" field for ordering,
 - some kind of user/channel metadata when available.
 """
@@ -40,44 +44,75 @@ import csv
 import json
 import io
 import os
+import re
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Union
+
+try:
+    # Optional: lets large JSON exports be parsed incrementally, without
+    # decoding the whole file to str and building the full object tree.
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    # Optional: faster JSON parser that reads the raw bytes directly.
+    import orjson
+except ImportError:
+    orjson = None
 
 
 SlackMessage = Dict[str, Any]
 
+# Dispatch helpers for parse_slack: first non-whitespace character, and
+# any CSV-ish separator, each found in one scan without copying content.
+_FIRST_CHAR_RE = re.compile(r"\S")
+_SEPARATOR_RE = re.compile(r"[,\t;]")
 
-def _safe_read(file_obj) -> str:
-    """
-    Safely reads the entire content of file_obj as UTF-8 text.
 
-    Works with:
-    - Streamlit UploadedFile
-    - File-like objects (BytesIO, TextIO)
-    - Open file handles
+def _read_raw(file_obj) -> Union[bytes, str]:
+    """
+    Reads the entire content of file_obj as-is (bytes, or str for text-mode
+    files) and rewinds it. Returns "" if the file can't be read.
     """
-    # Try to read bytes, then decode
     try:
         data = file_obj.read()
     except Exception:
         return ""
 
-    # If we got bytes, decode; if already str, return as-is
-    if isinstance(data, bytes):
-        try:
-            text = data.decode("utf-8", errors="ignore")
-        except Exception:
-            text = data.decode(errors="ignore")
-    else:
-        text = str(data)
-
     # Reset cursor so other parts of the system can re-use the file if needed
     try:
         file_obj.seek(0)
     except Exception:
         pass
 
-    return text
+    return data
+
+
+def _decode_text(data: Union[bytes, str]) -> str:
+    """
+    Decodes raw file content to str (UTF-8, ignoring invalid bytes).
+    """
+    # If we got bytes, decode; if already str, return as-is
+    if isinstance(data, bytes):
+        try:
+            return data.decode("utf-8", errors="ignore")
+        except Exception:
+            return data.decode(errors="ignore")
+    return str(data)
+
+
+def _safe_read(file_obj) -> str:
+    """
+    Safely reads the entire content of file_obj as UTF-8 text.
+
+    Works with:
+    - Streamlit UploadedFile
+    - File-like objects (BytesIO, TextIO)
+    - Open file handles
+    """
+    return _decode_text(_read_raw(file_obj))
 
 
 def _guess_channel_from_name(file_obj) -> Optional[str]:
@@ -164,10 +199,10 @@ def _normalize_json_message(
     return {
         "platform": "slack",
         "message_id": str(message_id),
-        "user": str(username) if username is not None else None,
+        "sender": str(username) if username is not None else None,
         "user_id": str(user_id) if user_id is not None else None,
         "channel": channel,
-        "text": str(text),
+        "content": str(text),
         "timestamp": iso_ts,
         "raw": msg,
     }
@@ -183,13 +218,21 @@ def _parse_json_export(content: str, channel: Optional[str]) -> List[SlackMessag
           ...
         ]
     """
-    messages: List[SlackMessage] = []
-
     try:
         data = json.loads(content)
     except Exception:
         return []
 
+    return _messages_from_json(data, channel)
+
+
+def _messages_from_json(data: Any, channel: Optional[str]) -> List[SlackMessage]:
+    """
+    Normalizes an already-parsed Slack JSON export (list of messages, or an
+    object with a "messages" key) into SlackMessage dicts.
+    """
+    messages: List[SlackMessage] = []
+
     # Export might be a list of messages or an object with a "messages" key
     if isinstance(data, dict):
         if "messages" in data and isinstance(data["messages"], list):
@@ -221,6 +264,74 @@ def _parse_json_export(content: str, channel: Optional[str]) -> List[SlackMessag
     return messages
 
 
+def _peek_json_start(file_obj) -> Optional[bytes]:
+    """
+    Peeks at the start of a binary file (then rewinds it) and returns the
+    first non-whitespace byte if it is b"[" or b"{", b"" if it is anything
+    else, or None when the file can't be peeked (text-mode, not seekable).
+
+    Lets parse_slack route to the JSON parsers without reading or decoding
+    the whole file first.
+    """
+    try:
+        head = file_obj.read(64)
+        file_obj.seek(0)
+    except Exception:
+        return None
+
+    if not isinstance(head, bytes):
+        try:
+            file_obj.seek(0)
+        except Exception:
+            pass
+        return None
+
+    first = head.lstrip()[:1]
+    return first if first in (b"[", b"{") else b""
+
+
+def _stream_json_export(
+    file_obj,
+    json_start: Optional[bytes],
+    channel: Optional[str],
+) -> List[SlackMessage]:
+    """
+    Streaming variant of _parse_json_export, used when `ijson` is installed.
+
+    Reads messages one at a time straight from the binary file object
+    (top-level array, or the "messages" array of an object), given the
+    first byte found by _peek_json_start. Returns [] when the file can't be
+    streamed this way (text-mode file, other JSON shapes, malformed JSON),
+    so the caller falls back to the regular path. The file cursor is
+    rewound in every case.
+    """
+    if ijson is None:
+        return []
+
+    if json_start == b"[":
+        prefix = "item"
+    elif json_start == b"{":
+        prefix = "messages.item"
+    else:
+        return []
+
+    messages: List[SlackMessage] = []
+    try:
+        for idx, raw_msg in enumerate(ijson.items(file_obj, prefix, use_float=True)):
+            if isinstance(raw_msg, dict):
+                messages.append(_normalize_json_message(raw_msg, idx, channel))
+    except Exception:
+        # Malformed JSON: same outcome as json.loads failing
+        messages = []
+    finally:
+        try:
+            file_obj.seek(0)
+        except Exception:
+            pass
+
+    return messages
+
+
 def _normalize_csv_row(
     row: Dict[str, Any],
     idx: int,
@@ -279,15 +390,28 @@ def _normalize_csv_row(
     return {
         "platform": "slack",
         "message_id": str(message_id),
-        "user": str(username) if username is not None else None,
+        "sender": str(username) if username is not None else None,
         "user_id": str(user_id) if user_id is not None else None,
         "channel": str(csv_channel) if csv_channel is not None else None,
-        "text": str(text),
+        "content": str(text),
         "timestamp": iso_ts,
         "raw": row,
     }
 
 
+@lru_cache(maxsize=64)
+def _sniff_dialect(sample: str):
+    """
+    csv.Sniffer().sniff(sample), cached per sample (the first 1KB of the
+    file), so re-uploading the same or a similar export skips the sniffing
+    heuristics. Returns None when no dialect can be determined.
+    """
+    try:
+        return csv.Sniffer().sniff(sample)
+    except csv.Error:
+        return None
+
+
 def _parse_csv_export(content: str, channel: Optional[str]) -> List[SlackMessage]:
     """
     Attempts to parse `content` as a CSV with message rows.
@@ -304,22 +428,30 @@ def _parse_csv_export(content: str, channel: Optional[str]) -> List[SlackMessage
     sio = io.StringIO(content)
 
     # Try to sniff dialect; fall back to default
+    dialect = _sniff_dialect(content[:1024])
     try:
-        sample = content[:1024]
-        dialect = csv.Sniffer().sniff(sample)
-        sio.seek(0)
-        reader = csv.DictReader(sio, dialect=dialect)
+        reader = csv.reader(sio, dialect=dialect) if dialect else csv.reader(sio)
     except Exception:
-        sio.seek(0)
-        reader = csv.DictReader(sio)
+        reader = csv.reader(sio)
 
-    if not reader.fieldnames:
+    # csv.reader + dict(zip(...)) instead of csv.DictReader: same dicts
+    # (extra cells under the None key, missing cells as None, blank rows
+    # skipped), without DictReader's Python-level __next__ per row.
+    fieldnames = next(reader, None)
+    if not fieldnames:
         return messages
 
-    for idx, row in enumerate(reader):
-        if not row:
-            continue
-        messages.append(_normalize_csv_row(row, idx, channel))
+    n_fields = len(fieldnames)
+    append = messages.append
+
+    for idx, cells in enumerate(cells for cells in reader if cells):
+        row = dict(zip(fieldnames, cells))
+        n_cells = len(cells)
+        if n_cells > n_fields:
+            row[None] = cells[n_fields:]
+        elif n_cells < n_fields:
+            row.update(dict.fromkeys(fieldnames[n_cells:]))
+        append(_normalize_csv_row(row, idx, channel))
 
     return messages
 
@@ -342,10 +474,10 @@ def _parse_fallback_lines(content: str, channel: Optional[str]) -> List[SlackMes
             {
                 "platform": "slack",
                 "message_id": f"slack_line_{idx}",
-                "user": "unknown",
+                "sender": "unknown",
                 "user_id": None,
                 "channel": channel,
-                "text": text,
+                "content": text,
                 "timestamp": "",
                 "raw": line,
             }
@@ -375,23 +507,50 @@ def parse_slack(file_obj) -> List[SlackMessage]:
     ImportError for `parse_slack`.
     """
     try:
-        content = _safe_read(file_obj)
         channel = _guess_channel_from_name(file_obj)
 
-        if not content.strip():
-            return []
+        # Route on the first bytes only: JSON parsers below are tried just
+        # for files that start like JSON (None = couldn't peek, so try).
+        json_start = _peek_json_start(file_obj)
+        looks_like_json = json_start != b""
 
-        stripped = content.lstrip()
+        # 0) Large JSON exports: stream them when ijson is available
+        if looks_like_json:
+            messages = _stream_json_export(file_obj, json_start, channel)
+            if messages:
+                return messages
+
+        raw = _read_raw(file_obj)
+
+        # 1a) With orjson, parse the raw bytes directly: no UTF-8 decode to
+        # str first. Anything orjson rejects (non-JSON, invalid UTF-8, BOM,
+        # NaN, huge ints...) goes through the regular path below.
+        if looks_like_json and orjson is not None and isinstance(raw, bytes):
+            try:
+                data = orjson.loads(raw)
+            except orjson.JSONDecodeError:
+                pass
+            else:
+                messages = _messages_from_json(data, channel)
+                if messages:
+                    return messages
+
+        content = _decode_text(raw)
+
+        first = _FIRST_CHAR_RE.search(content)
+        if first is None:
+            # empty or whitespace-only
+            return []
 
         # 1) Try JSON first if it looks like JSON
-        if stripped.startswith("{") or stripped.startswith("["):
+        if first.group() in ("{", "["):
             messages = _parse_json_export(content, channel)
             if messages:
                 return messages
             # If JSON attempt fails or returns empty, continue to CSV / fallback
 
         # 2) Try CSV if there are obvious separators
-        if "," in content or "\t" in content or ";" in content:
+        if _SEPARATOR_RE.search(content):
             csv_messages = _parse_csv_export(content, channel)
             if csv_messages:
                 return csv_messages
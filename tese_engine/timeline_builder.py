@@ -28,23 +28,26 @@ class TimelineBuilder:
 
         V8-style ordering and normalization.
         """
+        # datetime.min vinculado como default do lambda: evita LOAD_GLOBAL +
+        # LOAD_ATTR a cada chamada da key.
         ordered = sorted(
             merged_messages,
-            key=lambda x: x.get("timestamp") or datetime.min
+            key=lambda x, _min=datetime.min: x.get("timestamp") or _min
         )
 
-        timeline = []
-        for msg in ordered:
-            timeline.append({
+        # Entradas montadas numa list comprehension (LIST_APPEND em vez de
+        # timeline.append por mensagem).
+        return [
+            {
                 "timestamp": msg.get("timestamp"),
                 "platform": msg.get("platform"),
                 "sender": msg.get("sender") or msg.get("user"),
                 "content": msg.get("content") or msg.get("text", ""),
                 "score": msg.get("score", 0),
                 "flags": msg.get("flags", []),
-            })
-
-        return timeline
+            }
+            for msg in ordered
+        ]
 
 
 # ---------------------------------------------------------------------------
@@ -101,12 +101,7 @@ def generate_quiz(analysis_data: Dict[str, Any]) -> Dict[str, Any]:
             opts.append(top_kw)
 
         # remove duplicadas mantendo ordem
-        seen = set()
-        options = []
-        for o in opts:
-            if o not in seen:
-                seen.add(o)
-                options.append(o)
+        options = list(dict.fromkeys(opts))
 
         # índice da resposta correta
         correct_index = options.index(top_kw)
@@ -133,12 +128,7 @@ def generate_quiz(analysis_data: Dict[str, Any]) -> Dict[str, Any]:
         if top_sender not in opts:
             opts.append(top_sender)
 
-        seen = set()
-        options = []
-        for o in opts:
-            if o not in seen:
-                seen.add(o)
-                options.append(o)
+        options = list(dict.fromkeys(opts))
 
         correct_index = options.index(top_sender)
 
@@ -7,9 +7,11 @@ a partir dos dados agregados de análise.
 Compatibilidade:
     - Expõe a função generate_video_script(analysis_data),
       importada por engine_bridge.create_video_overview.
+    - generate_video_script_lines(analysis_data) é a versão em streaming
+      (engine_bridge.create_video_overview_stream).
 """
 
-from typing import Any, Dict
+from typing import Any, Dict, Iterator
 
 
 def generate_video_script(analysis_data: Dict[str, Any]) -> str:
@@ -35,6 +37,14 @@ def generate_video_script(analysis_data: Dict[str, Any]) -> str:
     Retorna:
         Uma string com o script do vídeo.
     """
+    return "\n".join(generate_video_script_lines(analysis_data))
+
+
+def generate_video_script_lines(analysis_data: Dict[str, Any]) -> Iterator[str]:
+    """
+    Mesmo roteiro de generate_video_script, entregue linha a linha
+    (sem "\n"), para a UI ir mostrando o texto enquanto é gerado.
+    """
     if not isinstance(analysis_data, dict):
         analysis_data = {}
 
@@ -49,10 +59,8 @@ def generate_video_script(analysis_data: Dict[str, Any]) -> str:
     top_senders = patterns.get("top_senders", []) or []
 
     # Começa o script
-    lines = []
-
-    lines.append("Olá, este é um overview automático gerado pelo TESE.")
-    lines.append(
+    yield "Olá, este é um overview automático gerado pelo TESE."
+    yield (
         f"Nesta investigação foram analisadas aproximadamente {total_messages} mensagens em múltiplas plataformas."
     )
 
@@ -61,7 +69,7 @@ def generate_video_script(analysis_data: Dict[str, Any]) -> str:
         high = incident_counts.get("high", 0)
         medium = incident_counts.get("medium", 0)
         low = incident_counts.get("low", 0)
-        lines.append(
+        yield (
             f"Foram identificados {high} incidentes de alta severidade, "
             f"{medium} de severidade média e {low} de baixa severidade."
         )
@@ -69,22 +77,20 @@ def generate_video_script(analysis_data: Dict[str, Any]) -> str:
     # Bloco de palavras-chave / flags
     if top_keywords:
         keywords_str = ", ".join([kw for kw, _ in top_keywords])
-        lines.append(
+        yield (
             f"As principais palavras-chave e sinais de risco encontrados incluem: {keywords_str}."
         )
 
     # Bloco de remetentes / participantes
     if top_senders:
         senders_str = ", ".join([sender for sender, _ in top_senders])
-        lines.append(
+        yield (
             f"Os participantes que mais se destacam nas comunicações são: {senders_str}."
         )
 
     # Encerramento
-    lines.append(
+    yield (
         "Este resumo não substitui a leitura integral do relatório, "
         "mas oferece uma visão rápida dos principais riscos identificados."
     )
-    lines.append("Para mais detalhes, consulte o relatório forense completo gerado pelo TESE.")
-
-    return "\n".join(lines)
+    yield "Para mais detalhes, consulte o relatório forense completo gerado pelo TESE."
@@ -17,6 +17,7 @@ and returns a dict:
 
 import re
 from datetime import datetime
+from functools import lru_cache
 from typing import List, Dict, Any
 
 
@@ -24,6 +25,13 @@ from typing import List, Dict, Any
 # Exemplos:
 #   [12/11/2025, 21:45] João: mensagem
 #   12/11/2025, 21:45 - João: mensagem
+#
+# O separador opcional (espaços / hífen / traço) antes do remetente NÃO
+# fica no regex: com "\s*[-–]?\s*" seguido de um remetente preguiçoso,
+# uma linha com cabeçalho de data e muitos espaços sem ":" levava a
+# backtracking catastrófico (segundos por linha). Aqui o remetente é a
+# sequência sem ":" até o primeiro ":" (linear), e o separador é removido
+# depois, em _clean_sender, com o mesmo resultado do padrão anterior.
 WHATSAPP_LINE_RE = re.compile(
     r"""
     ^                               # início da linha
@@ -32,25 +40,73 @@ WHATSAPP_LINE_RE = re.compile(
     ,\s+
     (?P<time>\d{1,2}:\d{2}(?::\d{2})?)  # hora 21:45 ou 21:45:02
     (?:\])?                         # fecha colchete opcional
-    \s*[-–]?\s*                     # hífen/traço opcional
-    (?P<sender>[^:]+?):\s+          # nome do remetente até dois pontos
+    (?P<sender>[^:]+):\s+           # separador + remetente até dois pontos
     (?P<content>.+)                 # conteúdo da mensagem
     $
     """,
     re.VERBOSE,
 )
 
+_DASHES = ("-", "–")
 
+# Uma linha só pode iniciar mensagem nova se começar com "[" ou dígito
+# (âncora do WHATSAPP_LINE_RE); as demais nem passam pelo regex.
+_ANCHOR_CHARS = frozenset("[0123456789")
+
+
+def _clean_sender(raw: str) -> str:
+    """
+    Remove o separador opcional (espaços, hífen/traço, espaços) do início
+    do grupo sender e devolve o nome já com strip().
+
+    Quando só há separador antes do ":", o resultado é "" — ou o próprio
+    traço, se ele vier colado ao ":" (mesmo comportamento do regex antigo).
+    """
+    name = raw.lstrip()
+    if name[:1] in _DASHES:
+        name = name[1:].lstrip()
+    if name:
+        return name.rstrip()
+    tail = raw[-1:]
+    return tail if tail in _DASHES else ""
+
+
+# Mensagens em sequência costumam repetir o mesmo minuto: cache por
+# (data, hora) evita reconverter o mesmo par a cada linha.
+@lru_cache(maxsize=4096)
 def _parse_datetime(date_str: str, time_str: str) -> str:
     """
     Tenta converter strings de data/hora em ISO 8601.
     Se falhar, retorna string vazia.
+
+    Equivale a tentar, em ordem, os formatos
+        %d/%m/%Y, %d/%m/%y, %m/%d/%Y, %m/%d/%y  (+ " %H:%M" ou " %H:%M:%S")
+    com strptime, mas os campos (já validados pelo WHATSAPP_LINE_RE como
+    dígitos) são convertidos direto para int: sem reparse de formato nem
+    até 8 tentativas com exceção por linha.
     """
-    for fmt in ("%d/%m/%Y %H:%M", "%d/%m/%y %H:%M", "%m/%d/%Y %H:%M", "%m/%d/%y %H:%M",
-                "%d/%m/%Y %H:%M:%S", "%d/%m/%y %H:%M:%S", "%m/%d/%Y %H:%M:%S", "%m/%d/%y %H:%M:%S"):
+    try:
+        first, second, year = date_str.split("/")
+        time_parts = time_str.split(":")
+        hour, minute = int(time_parts[0]), int(time_parts[1])
+        second_ = int(time_parts[2]) if len(time_parts) == 3 else 0
+        a, b = int(first), int(second)
+    except ValueError:
+        return ""
+
+    # %Y exige 4 dígitos, %y exige 2 (00-68 -> 20xx, 69-99 -> 19xx)
+    if len(year) == 4:
+        y = int(year)
+    elif len(year) == 2:
+        y = int(year)
+        y += 2000 if y <= 68 else 1900
+    else:
+        return ""
+
+    # dia/mês primeiro; se a data não existir, mês/dia
+    for day, month in ((a, b), (b, a)):
         try:
-            dt = datetime.strptime(f"{date_str} {time_str}", fmt)
-            return dt.isoformat()
+            return datetime(y, month, day, hour, minute, second_).isoformat()
         except ValueError:
             continue
     return ""
@@ -64,13 +120,17 @@ def _parse_whatsapp_text(content: str) -> List[Dict[str, Any]]:
     messages: List[Dict[str, Any]] = []
     current_msg = None
     msg_id = 0
+    match_line = WHATSAPP_LINE_RE.match
+    anchor_chars = _ANCHOR_CHARS
 
     for raw_line in content.splitlines():
         line = raw_line.strip()
         if not line:
             continue
 
-        m = WHATSAPP_LINE_RE.match(line)
+        # Fase 1: filtro barato pelo primeiro caractere (continuações de
+        # mensagem caem aqui); fase 2: regex completo só nas âncoras.
+        m = match_line(line) if line[0] in anchor_chars else None
         if m:
             # Nova mensagem
             msg_id += 1
@@ -84,7 +144,7 @@ def _parse_whatsapp_text(content: str) -> List[Dict[str, Any]]:
                 "id": msg_id,
                 "platform": "whatsapp",
                 "timestamp": ts_iso,
-                "sender": d["sender"].strip(),
+                "sender": _clean_sender(d["sender"]),
                 "content": d["content"].strip(),
                 "raw_line": raw_line,
             }
@@ -1,121 +1,519 @@
 # ui_studio_panel.py
 # UI do painel Estúdio (Studio) – TESE V9 BACKEND CONNECTED
 
+import threading
+import time
+from collections import deque
+from concurrent.futures import Executor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
 import streamlit as st
 
-from analysis_runner import analyze_uploaded_files
-from output_builder import (
-    build_report,
-    build_mindmap,
-    build_video_script,
-    build_flashcards,
-    build_quiz,
-    build_audio_overview,
-    export_case_json_outputs,
-    export_tese_bundle,
-    build_all_outputs_for_case,
+# analysis_runner / output_builder (engine, parsers, reportlab…) são
+# importados só dentro das funções que os usam: o primeiro render do
+# painel não paga esse import, e os seguintes acham o módulo já carregado.
+from case_manager import update_case_exports
+from runtime import build_executor, executor
+
+
+# --------------------------------------------------------------------
+# HTML estático do painel (montado uma vez, no import)
+# --------------------------------------------------------------------
+
+_PANEL_HEADER = """
+<div class="ws-panel">
+  <div class="ws-panel-header">Studio</div>
+  <div class="ws-panel-title">Estúdio</div>
+  <div class="ws-panel-subtitle">
+    Ferramentas avançadas conectadas ao TESE Engine:
+    relatórios, vídeos, mapas mentais e materiais de estudo.
+  </div>
+  <div class="ws-panel-body">
+"""
+_PANEL_FOOTER = "</div></div>"
+_GRID_OPEN = '<div class="studio-grid">'
+_GRID_CLOSE = "</div>"
+
+
+# --------------------------------------------------------------------
+# Análise com cache entre botões / reruns
+# --------------------------------------------------------------------
+
+def _uploaded_file_key(f: Any) -> Tuple[Any, Any]:
+    """
+    Hash de um UploadedFile para o st.cache_data: (file_id, size).
+
+    Cada upload tem file_id próprio e conteúdo imutável, então isso
+    identifica o arquivo sem ler/hashear os bytes a cada rerun.
+    """
+    return (f.file_id, f.size)
+
+
+@st.cache_data(
+    show_spinner=False,
+    hash_funcs={"streamlit.runtime.uploaded_file_manager.UploadedFile": _uploaded_file_key},
 )
+def _cached_analysis(files: Tuple[Any, ...]) -> Dict[str, Any]:
+    """
+    analyze_uploaded_files memoizado pelo Streamlit.
+
+    A chave é a própria tupla de arquivos: UploadedFile entra como
+    (file_id, size) via hash_funcs (o hasher padrão não sabe lidar com
+    ele); os dicts do case_manager usam o hash padrão do Streamlit.
+    Todos os botões do Studio reaproveitam a mesma análise.
+    """
+    from analysis_runner import analyze_uploaded_files
+
+    return analyze_uploaded_files(list(files))
+
+
+def _file_ref(f: Any) -> Optional[str]:
+    """
+    Id estável de um arquivo do case: f["id"] para os dicts do
+    case_manager, file_id para UploadedFile. None se não houver.
+    """
+    if isinstance(f, dict):
+        ref = f.get("id")
+    else:
+        ref = getattr(f, "file_id", None)
+    return str(ref) if ref else None
+
+
+def _selected_files(case: Dict[str, Any]) -> Tuple[Tuple[Any, ...], Optional[Tuple[str, ...]]]:
+    """
+    Arquivos selecionados do case (tupla, calculada uma vez por rerun) e a
+    `selected_key`: ids ordenados desses arquivos, ou None se algum não
+    tiver id (aí só o fingerprint de conteúdo identifica o conjunto).
+    """
+    selected = tuple(f for f in case.get("files", []) if f.get("selected", True))
+    refs = [_file_ref(f) for f in selected]
+    if all(refs):
+        return selected, tuple(sorted(refs))
+    return selected, None
+
+
+def _analyze_selected(
+    case: Dict[str, Any],
+    selected_files: Tuple[Any, ...],
+    selected_key: Optional[Tuple[str, ...]],
+) -> Dict[str, Any]:
+    """
+    Análise dos arquivos selecionados do case, guardada em
+    st.session_state["studio_analysis"][case_id] junto com a selected_key.
+
+    Enquanto a selected_key não muda, os botões reutilizam o mesmo dict da
+    sessão (sem nem passar pelo st.cache_data, que devolve uma cópia a cada
+    chamada). Sem selected_key (arquivos sem id), sempre consulta o
+    st.cache_data. Só a análise mais recente de cada case fica na sessão.
+    """
+    by_case = st.session_state.setdefault("studio_analysis", {})
+    case_id = case.get("id")
+
+    entry = by_case.get(case_id)
+    if (
+        entry is not None
+        and selected_key is not None
+        and entry.get("selected_key") == selected_key
+    ):
+        return entry["result"]
+
+    entry = {
+        "selected_key": selected_key,
+        "result": _cached_analysis(selected_files),
+    }
+    by_case[case_id] = entry
+
+    return entry["result"]
+
+
+# --------------------------------------------------------------------
+# Jobs do Studio (executor compartilhado + futures por case)
+# --------------------------------------------------------------------
+
+# Intervalo do polling (run_every dos fragments de acompanhamento)
+_JOB_POLL_SECONDS = 0.5
+
+# Chave do job de export no dict de jobs do case
+_EXPORT_JOB_KEY = "studio_export_case"
+
+
+def _case_jobs(case_id: Any) -> Dict[str, Dict[str, Any]]:
+    """
+    Jobs do case em st.session_state["studio_jobs"][case_id], por chave
+    do botão: {"future", "action", "lines", "steps", "cancel", "seconds",
+    "collected"}.
+    """
+    return st.session_state.setdefault("studio_jobs", {}).setdefault(case_id, {})
+
+
+def _is_running(job: Optional[Dict[str, Any]]) -> bool:
+    return job is not None and not job["future"].done()
+
+
+def _run_action(
+    builder: Callable[[Dict[str, Any]], Any],
+    analysis_data: Dict[str, Any],
+    job: Dict[str, Any],
+) -> Any:
+    """
+    Corpo de um job de builder. Nos outputs de texto, as linhas vão sendo
+    acumuladas em job["lines"] (_builder_progress mostra o parcial) e o
+    retorno é "\n".join delas, igual ao build_* equivalente.
+
+    job["seconds"] guarda só o tempo do builder (a análise é compartilhada).
+    """
+    t0 = time.perf_counter()
+    try:
+        content = builder(analysis_data)
+        lines = job["lines"]
+        if lines is not None:
+            for line in content:
+                lines.append(line)
+            content = "\n".join(lines)
+        return content
+    finally:
+        job["seconds"] = time.perf_counter() - t0
+
+
+def _submit_job(
+    case_id: Any,
+    key: str,
+    action: str,
+    fn: Callable[..., Any],
+    *args: Any,
+    text: bool = False,
+) -> None:
+    """
+    Agenda fn(*args, job) no executor e registra o job do case sob `key`.
+    """
+    job: Dict[str, Any] = {
+        "action": action,
+        "lines": [] if text else None,
+        "steps": [],                   # etapas já iniciadas (export)
+        "cancel": threading.Event(),   # pedido de cancelamento (export)
+        "seconds": None,
+        "collected": False,
+    }
+    job["future"] = executor().submit(fn, *args, job)
+    _case_jobs(case_id)[key] = job
+
+
+# --------------------------------------------------------------------
+# JSON grande: paginado
+# --------------------------------------------------------------------
+
+# Itens por "página" nas listas dos outputs JSON
+_JSON_PAGE_SIZE = 50
+
+# Outputs em memória do export (no resumo aparecem só os tamanhos)
+_EXPORT_OUTPUT_KEYS = ("report", "mindmap", "video_script", "flashcards", "quiz", "audio")
+
+
+def _json_page(obj: Any, limit: int) -> Tuple[Any, int]:
+    """
+    Visão de `obj` com toda lista, em qualquer nível, cortada em `limit`
+    itens (ex.: quiz["questions"], os children aninhados do mindmap).
+    Só os itens visíveis são percorridos. Retorna (visão, itens
+    escondidos, somados em todos os níveis).
+    """
+    if isinstance(obj, list):
+        hidden = max(len(obj) - limit, 0)
+        view = []
+        for item in obj[:limit]:
+            item_view, item_hidden = _json_page(item, limit)
+            view.append(item_view)
+            hidden += item_hidden
+        return view, hidden
+    if isinstance(obj, dict):
+        hidden = 0
+        view = {}
+        for k, v in obj.items():
+            view[k], v_hidden = _json_page(v, limit)
+            hidden += v_hidden
+        return view, hidden
+    return obj, 0
+
+
+def _show_more(state_key: str) -> None:
+    st.session_state[state_key] = st.session_state.get(state_key, _JSON_PAGE_SIZE) + _JSON_PAGE_SIZE
+
+
+def _render_json(obj: Any, key: str) -> None:
+    """
+    st.json paginado: só os primeiros _JSON_PAGE_SIZE itens de cada lista
+    vão para o browser, mais um botão "Mostrar mais" que aumenta o limite
+    (guardado em st.session_state[f"{key}_limit"]).
+    """
+    state_key = f"{key}_limit"
+    view, hidden = _json_page(obj, st.session_state.get(state_key, _JSON_PAGE_SIZE))
+    st.json(view)
+    if hidden:
+        st.button(
+            f"Mostrar mais ({hidden} itens ocultos)",
+            key=f"{key}_more",
+            on_click=_show_more,
+            args=(state_key,),
+        )
+
+
+def _export_summary(export_result: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Resumo do export para exibição: case_id, caminhos/infos dos arquivos
+    gerados e só o tamanho de cada output em memória.
+    """
+    summary = {
+        "case_id": export_result.get("case_id"),
+        "json_exports": export_result.get("json_exports"),
+        "bundle_export": export_result.get("bundle_export"),
+        "pdf_export": export_result.get("pdf_export"),
+    }
+    summary["outputs"] = {
+        name: _size_label(export_result.get(name)) for name in _EXPORT_OUTPUT_KEYS
+    }
+    return summary
+
+
+def _size_label(value: Any) -> str:
+    if isinstance(value, str):
+        return f"{len(value)} caracteres"
+    if isinstance(value, list):
+        return f"{len(value)} itens"
+    if isinstance(value, dict):
+        return f"{len(value)} campos"
+    return type(value).__name__
+
 
-from case_manager import (
-    load_cases,
-    save_cases,
-    attach_exports_to_case,
+# --------------------------------------------------------------------
+# Latência por ação do Studio
+# --------------------------------------------------------------------
+
+# Quantas execuções recentes ficam no log da sessão
+_LATENCY_LOG_SIZE = 50
+
+
+def _log_latency(action: str, case_id: Any, seconds: float) -> None:
+    """
+    Registra a duração de uma ação em st.session_state["studio_latencies"]
+    (deque limitado às últimas _LATENCY_LOG_SIZE execuções).
+    """
+    log = st.session_state.get("studio_latencies")
+    if log is None:
+        log = deque(maxlen=_LATENCY_LOG_SIZE)
+        st.session_state["studio_latencies"] = log
+    log.append({"action": action, "case": case_id, "seconds": round(seconds, 3)})
+
+
+# --------------------------------------------------------------------
+# Export em segundo plano
+# --------------------------------------------------------------------
+
+def _export_job(
+    case: Dict[str, Any],
+    analysis_data: Dict[str, Any],
+    build_pool: Executor,
+    job: Dict[str, Any],
+) -> Dict[str, Any]:
+    """
+    Corpo do job de export: gera todos os outputs + JSON + bundle e
+    atualiza o case no case_manager. O retorno (ou a exceção) fica no
+    Future do job, consultado a cada rerun.
+
+    As etapas iniciadas vão para job["steps"] (mostradas no st.status) e
+    job["cancel"] interrompe o export entre uma etapa e outra.
+
+    build_pool é o build_executor(), obtido na thread do script: a thread
+    do worker não tem ScriptRunContext para chamar st.cache_resource.
+    """
+    from output_builder import build_all_outputs_for_case
+
+    t0 = time.perf_counter()
+    try:
+        export_result = build_all_outputs_for_case(
+            case=case,
+            analysis_data=analysis_data,
+            include_messages=True,
+            cancel=job["cancel"],
+            on_step=job["steps"].append,
+            executor=build_pool,
+        )
+
+        # Atualizar no case_manager (só este case)
+        update_case_exports(
+            case["id"],
+            json_summary_path=export_result["json_exports"]["summary_path"],
+            json_messages_path=export_result["json_exports"]["messages_path"],
+            bundle_path=export_result["bundle_export"]["bundle_path"],
+        )
+
+        return export_result
+    finally:
+        job["seconds"] = time.perf_counter() - t0
+
+
+def _collect_finished(case_id: Any) -> None:
+    """
+    Passa os jobs de builder já concluídos do case para a UI (uma vez por
+    job): output em st.session_state["studio_output"] + log de latência.
+    """
+    for key, job in _case_jobs(case_id).items():
+        if job["collected"] or not job["future"].done():
+            continue
+        job["collected"] = True
+        if job["seconds"] is not None:
+            _log_latency(job["action"], case_id, job["seconds"])
+        if key == _EXPORT_JOB_KEY:
+            continue
+
+        # Output novo: paginação do JSON volta para a primeira página
+        st.session_state.pop("studio_output_json_limit", None)
+        exc = job["future"].exception()
+        if exc is not None:
+            st.session_state["studio_output"] = (job["action"], f"ERROR: {exc}")
+        else:
+            st.session_state["studio_output"] = (job["action"], job["future"].result())
+
+
+@st.fragment(run_every=_JOB_POLL_SECONDS)
+def _export_progress(job: Dict[str, Any]) -> None:
+    """
+    Acompanhamento do job de export: st.status com as etapas e botão de
+    cancelar. Só este bloco é redesenhado a cada _JOB_POLL_SECONDS; quando
+    o job termina, um único rerun completo mostra o resultado.
+    """
+    future = job["future"]
+    if future.done():
+        st.rerun()
+
+    steps = job["steps"]
+    current = steps[-1] if steps else "Na fila"
+    with st.status(f"Exportando… {current}", expanded=True):
+        for step in steps[:-1]:
+            st.write(f"✓ {step}")
+        if job["cancel"].is_set():
+            st.write("Cancelando…")
+        elif st.button("Cancelar", key="studio_export_cancel"):
+            job["cancel"].set()
+            future.cancel()  # ainda na fila: nem chega a rodar
+            st.rerun(scope="fragment")
+
+
+def _render_export_job(job: Dict[str, Any]) -> None:
+    """
+    Estado do job de export: progresso (_export_progress) enquanto roda;
+    depois, sucesso, cancelamento ou erro.
+    """
+    future = job["future"]
+    if not future.done():
+        _export_progress(job)
+        return
+
+    from output_builder import ExportCancelled
+
+    if future.cancelled() or isinstance(future.exception(), ExportCancelled):
+        st.warning("Export cancelado.")
+    elif future.exception() is not None:
+        st.error(f"Falha no export: {future.exception()}")
+    else:
+        # Exibir resultados para o usuário (resumo; completo sob demanda)
+        export_result = future.result()
+        st.success("Arquivos exportados!")
+        st.json(_export_summary(export_result))
+        if st.checkbox("Mostrar resultado completo", key="studio_export_full"):
+            _render_json(export_result, key="studio_export_result")
+
+
+# --------------------------------------------------------------------
+# Botões do Studio
+# --------------------------------------------------------------------
+
+# (label, key, builder em output_builder, tipo de output, aviso, legenda).
+# O builder é resolvido por nome no clique (import preguiçoso).
+_STUDIO_ACTIONS = (
+    ("Reports", "studio_reports", "build_report_stream", "Report",
+     "Gerando relatório TESE…", "Relatório detalhado TESE"),
+    ("Mind map", "studio_mindmap", "build_mindmap", "Mindmap",
+     "Gerando mindmap…", "Mapa de entidades e relações"),
+    ("Video overview", "studio_video", "build_video_script_stream", "Video",
+     "Gerando roteiro para vídeo…", "Roteiro para vídeo explicativo"),
+    ("Audio overview", "studio_audio", "build_audio_overview_stream", "Audio",
+     "Gerando áudio…", "Resumo narrado do caso"),
+    ("Flashcards", "studio_flashcards", "build_flashcards", "Flashcards",
+     "Gerando flashcards…", "Pontos-chave para estudo"),
+    ("Quiz", "studio_quiz", "build_quiz", "Quiz",
+     "Gerando quiz…", "Testar entendimento do caso"),
 )
 
+# Outputs de texto: o builder é um gerador de linhas (streaming) e o
+# resultado vai para um text_area; os demais são JSON.
+_TEXT_OUTPUTS = frozenset({"Report", "Video", "Audio"})
 
-def render_studio_panel(case=None):
+
+@st.fragment(run_every=_JOB_POLL_SECONDS)
+def _builder_progress(case_id: Any) -> None:
     """
-    Desenha o painel Estúdio na direita.
-    Agora totalmente conectado ao backend TESE V9.
+    Parcial dos outputs de texto ainda em geração. Só este bloco é
+    redesenhado a cada _JOB_POLL_SECONDS; quando os jobs de builder do
+    case terminam, um único rerun completo coleta os outputs e reabilita
+    os botões.
     """
-    st.markdown(
-        """
-        <div class="ws-panel">
-          <div class="ws-panel-header">Studio</div>
-          <div class="ws-panel-title">Estúdio</div>
-          <div class="ws-panel-subtitle">
-            Ferramentas avançadas conectadas ao TESE Engine:
-            relatórios, vídeos, mapas mentais e materiais de estudo.
-          </div>
-          <div class="ws-panel-body">
-        """,
-        unsafe_allow_html=True,
-    )
+    running = [
+        job for key, job in _case_jobs(case_id).items()
+        if key != _EXPORT_JOB_KEY and _is_running(job)
+    ]
+    if not running:
+        st.rerun()
+
+    for job in running:
+        if job["lines"]:
+            st.text(f"{job['action']} (gerando…)\n" + "\n".join(job["lines"]))
 
-    # Obter arquivos vinculados ao caso
-    uploaded_files = case.get("files", [])
-    selected_files = [f for f in uploaded_files if f.get("selected", True)]
 
-    st.markdown('<div class="studio-grid">', unsafe_allow_html=True)
+@st.fragment
+def _studio_actions(
+    case: Dict[str, Any],
+    selected_files: Tuple[Any, ...],
+    selected_key: Optional[Tuple[str, ...]],
+) -> None:
+    """
+    Os seis botões do Studio + a caixa de output.
+
+    Roda como st.fragment: interações aqui rerodam só este bloco (e não
+    header, CSS, cases e export). Cada botão agenda seu builder no
+    executor (_submit_job) e reroda só o fragment; enquanto o job roda, o
+    botão fica desabilitado e _builder_progress mostra o texto parcial.
+    Ao terminar, o output vai para st.session_state["studio_output"].
+    """
+    st.markdown(_GRID_OPEN, unsafe_allow_html=True)
     st.caption("***Outputs gerados abaixo aparecerão automaticamente.***")
 
-    # ------------------------------------------------------------------
-    # 1) REPORT
-    # ------------------------------------------------------------------
-    if st.button("Reports", key="studio_reports", use_container_width=True):
-        st.info("Gerando relatório TESE…")
-        analysis_result = analyze_uploaded_files(selected_files)
-        report_text = build_report(analysis_result["analysis"])
-        st.session_state["studio_output"] = ("Report", report_text)
-
-    st.caption("Relatório detalhado TESE")
-
-    # ------------------------------------------------------------------
-    # 2) MINDMAP
-    # ------------------------------------------------------------------
-    if st.button("Mind map", key="studio_mindmap", use_container_width=True):
-        st.info("Gerando mindmap…")
-        analysis_result = analyze_uploaded_files(selected_files)
-        mindmap = build_mindmap(analysis_result["analysis"])
-        st.session_state["studio_output"] = ("Mindmap", mindmap)
-
-    st.caption("Mapa de entidades e relações")
-
-    # ------------------------------------------------------------------
-    # 3) VIDEO OVERVIEW
-    # ------------------------------------------------------------------
-    if st.button("Video overview", key="studio_video", use_container_width=True):
-        st.info("Gerando roteiro para vídeo…")
-        analysis_result = analyze_uploaded_files(selected_files)
-        video_script = build_video_script(analysis_result["analysis"])
-        st.session_state["studio_output"] = ("Video", video_script)
-
-    st.caption("Roteiro para vídeo explicativo")
-
-    # ------------------------------------------------------------------
-    # 4) AUDIO OVERVIEW
-    # ------------------------------------------------------------------
-    if st.button("Audio overview", key="studio_audio", use_container_width=True):
-        st.info("Gerando áudio…")
-        analysis_result = analyze_uploaded_files(selected_files)
-        audio_outline = build_audio_overview(analysis_result["analysis"])
-        st.session_state["studio_output"] = ("Audio", audio_outline)
-
-    st.caption("Resumo narrado do caso")
-
-    # ------------------------------------------------------------------
-    # 5) FLASHCARDS
-    # ------------------------------------------------------------------
-    if st.button("Flashcards", key="studio_flashcards", use_container_width=True):
-        st.info("Gerando flashcards…")
-        analysis_result = analyze_uploaded_files(selected_files)
-        cards = build_flashcards(analysis_result["analysis"])
-        st.session_state["studio_output"] = ("Flashcards", cards)
-
-    st.caption("Pontos-chave para estudo")
-
-    # ------------------------------------------------------------------
-    # 6) QUIZ
-    # ------------------------------------------------------------------
-    if st.button("Quiz", key="studio_quiz", use_container_width=True):
-        st.info("Gerando quiz…")
-        analysis_result = analyze_uploaded_files(selected_files)
-        quiz = build_quiz(analysis_result["analysis"])
-        st.session_state["studio_output"] = ("Quiz", quiz)
-
-    st.caption("Testar entendimento do caso")
-
-    st.markdown('</div>', unsafe_allow_html=True)
+    case_id = case.get("id")
+    jobs = _case_jobs(case_id)
+    _collect_finished(case_id)
+
+    for label, key, builder_name, output_type, info, caption in _STUDIO_ACTIONS:
+        job = jobs.get(key)
+        if st.button(label, key=key, use_container_width=True, disabled=_is_running(job)):
+            import output_builder
+
+            builder = getattr(output_builder, builder_name)
+            analysis_result = _analyze_selected(case, selected_files, selected_key)
+            _submit_job(
+                case_id, key, output_type, _run_action,
+                builder, analysis_result["analysis"],
+                text=output_type in _TEXT_OUTPUTS,
+            )
+            # Redesenha os botões (desabilitado) e liga o _builder_progress
+            st.rerun(scope="fragment")
+
+        if _is_running(job):
+            st.info(info)
+        st.caption(caption)
+
+    st.markdown(_GRID_CLOSE, unsafe_allow_html=True)
+
+    # Parcial dos outputs de texto ainda em geração
+    if any(_is_running(job) for key, job in jobs.items() if key != _EXPORT_JOB_KEY):
+        _builder_progress(case_id)
 
     # ----------------------------------------------------------------------
     # OUTPUT BOX (qualquer botão do studio)
@@ -126,11 +524,24 @@ def render_studio_panel(case=None):
         st.markdown("---")
         st.subheader(f"Output gerado: {output_type}")
 
-        if output_type in ["Report", "Video", "Audio"]:
+        if output_type in _TEXT_OUTPUTS:
             st.text_area("Resultado:", output_content, height=300)
 
-        elif output_type in ["Mindmap", "Flashcards", "Quiz"]:
-            st.json(output_content)
+        else:
+            _render_json(output_content, key="studio_output_json")
+
+
+def render_studio_panel(case=None):
+    """
+    Desenha o painel Estúdio na direita.
+    Agora totalmente conectado ao backend TESE V9.
+    """
+    st.markdown(_PANEL_HEADER, unsafe_allow_html=True)
+
+    # Obter arquivos vinculados ao caso
+    selected_files, selected_key = _selected_files(case)
+
+    _studio_actions(case, selected_files, selected_key)
 
     # ----------------------------------------------------------------------
     # 🟦 NOVA SEÇÃO: EXPORTS DO CASE (JSON + .TESE)
@@ -138,58 +549,45 @@ def render_studio_panel(case=None):
     st.markdown("---")
     st.subheader("📦 Exportar caso")
 
-    if st.button("Export JSON + Bundle (.TESE)", key="studio_export_case", use_container_width=True):
-        st.info("Exportando JSON + Bundle…")
+    jobs = _case_jobs(case.get("id"))
+    job = jobs.get(_EXPORT_JOB_KEY)
 
+    if st.button(
+        "Export JSON + Bundle (.TESE)",
+        key="studio_export_case",
+        use_container_width=True,
+        disabled=_is_running(job),
+    ):
         # Reprocessar análise (com cache)
-        analysis_result = analyze_uploaded_files(selected_files)
+        analysis_result = _analyze_selected(case, selected_files, selected_key)
         analysis_data = analysis_result["analysis"]
 
-        # 1) Gerar todos outputs em memória + export JSON + bundle
-        export_result = build_all_outputs_for_case(
-            case=case,
-            analysis_data=analysis_data,
-            include_messages=True,
+        # 1) Gerar todos outputs em memória + export JSON + bundle,
+        #    no executor: a UI continua respondendo enquanto exporta
+        _submit_job(
+            case.get("id"), _EXPORT_JOB_KEY, "Export", _export_job,
+            case, analysis_data, build_executor(),
         )
+        st.session_state.pop("studio_export_result_limit", None)
+        job = jobs[_EXPORT_JOB_KEY]
 
-        # Atualizar no case_manager
-        cases = load_cases()
-        # localizar o case atual
-        idx = next((i for i,c in enumerate(cases) if c["id"] == case["id"]), None)
-        if idx is not None:
-            cases = attach_exports_to_case(
-                cases,
-                idx,
-                json_summary_path=export_result["json_exports"]["summary_path"],
-                json_messages_path=export_result["json_exports"]["messages_path"],
-                bundle_path=export_result["bundle_export"]["bundle_path"],
-            )
-            save_cases(cases)
-
-        # Exibir resultados para o usuário
-        st.success("Arquivos exportados!")
-        st.json(export_result)
+    if job is not None:
+        _render_export_job(job)
 
     # ----------------------------------------------------------------------
-    # Lista de execuções recentes (dummy)
+    # Execuções recentes (latência por ação, mais recentes primeiro)
     # ----------------------------------------------------------------------
     st.markdown("### Recent studio runs")
-    dummy_runs = [
-        "Implosão da FIGO/ACSoftware: análise de conflitos",
-        "Estrutura e crise do grupo econômico",
-        "Digital sabotage & crédito bloqueado",
-        "Resumo em áudio das comunicações críticas",
-    ]
-    for r in dummy_runs:
-        st.markdown(
-            f"""
-            <div class="studio-run-item">
-              <div class="studio-run-title">{r}</div>
-              <div class="studio-run-meta">300 sources · 5d ago</div>
-            </div>
-            """,
-            unsafe_allow_html=True,
+    latencies = st.session_state.get("studio_latencies")
+    if latencies:
+        st.dataframe(
+            list(reversed(latencies)),
+            column_order=("action", "case", "seconds"),
+            hide_index=True,
+            use_container_width=True,
         )
+    else:
+        st.caption("Nenhuma execução do Studio nesta sessão.")
 
-    st.markdown("</div></div>", unsafe_allow_html=True)
+    st.markdown(_PANEL_FOOTER, unsafe_allow_html=True)
 